@@ -9,7 +9,7 @@ from fastapi_limiter import RateLimiter
 
 from app.core.security import (
     verify_password,
-    get_password_hash,
+    hash_password,
     create_access_token,
     validate_token,
     blacklist_token
@@ -77,7 +77,7 @@ async def register(user_data: UserCreate, request: Request) -> UserResponse:
             )
 
         # Hash password with Argon2
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await hash_password(user_data.password)
         
         # Create user in Firebase
         firebase_user = await firebase_service.create_user({
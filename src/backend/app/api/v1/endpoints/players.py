@@ -13,7 +13,8 @@ from app.core.logging import get_logger, CORRELATION_ID_CTX_VAR
 from app.utils.enums import SportType, PlayerPosition
 from app.utils.validators import SportValidator
 from app.core.config import settings
-from app.services.sportradar import SportradarService
+from app.services import get_sportradar_service
+from app.services.sportradar_service import SportradarService
 from app.schemas.player import PlayerBase, PlayerList, PlayerStats
 
 # Initialize components
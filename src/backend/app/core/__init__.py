@@ -32,6 +32,7 @@ from app.core.exceptions import (
 from app.core.security import (
     verify_password,
     get_password_hash,
+    hash_password,
     create_access_token,
     verify_token
 )
@@ -59,6 +60,7 @@ __all__ = [
     # Security
     'verify_password',
     'get_password_hash', 
+    'hash_password',
     'create_access_token',
     'verify_token'
 ]
\ No newline at end of file
@@ -1,4 +1,5 @@
 # Python 3.11+
+from functools import lru_cache
 from typing import Dict, List
 from pydantic import BaseSettings, Field, SecretStr, validator  # pydantic v2.0+
 from app.utils.enums import SportType
@@ -58,6 +59,10 @@ class Settings(BaseSettings):
     CACHE_TTL_SECONDS: int = Field(default=900, description="Default cache TTL in seconds (15 minutes)")
     API_TIMEOUT_SECONDS: int = Field(default=30, description="External API request timeout in seconds")
     MAX_RETRIES: int = Field(default=3, description="Maximum retry attempts for external API calls")
+    SPORTRADAR_MAX_CONNECTIONS: int = Field(default=100, description="Maximum concurrent Sportradar connections")
+    SPORTRADAR_MAX_KEEPALIVE_CONNECTIONS: int = Field(default=2, description="Idle Sportradar connections kept in the pool")
+    SPORTRADAR_KEEPALIVE_EXPIRY_SECONDS: float = Field(default=60.0, description="Idle time before a pooled Sportradar connection is closed")
+    EDGE_COMPRESSION_ENABLED: bool = Field(default=False, description="Response compression is handled by the reverse proxy")
 
     # Monitoring Settings
     LOG_LEVEL: str = Field(default="INFO", description="Application logging level")
@@ -132,12 +137,34 @@ class Settings(BaseSettings):
         Returns:
             Dict[str, str]: Firebase service account credentials
         """
-        return {
-            "type": "service_account",
-            "project_id": self.FIREBASE_PROJECT_ID.get_secret_value(),
-            "private_key": self.FIREBASE_PRIVATE_KEY.get_secret_value(),
-            "client_email": self.FIREBASE_CLIENT_EMAIL.get_secret_value(),
-        }
+        return _build_firebase_credentials(
+            self.FIREBASE_PROJECT_ID,
+            self.FIREBASE_PRIVATE_KEY,
+            self.FIREBASE_CLIENT_EMAIL
+        )
+
+@lru_cache(maxsize=1)
+def _build_firebase_credentials(
+    project_id: SecretStr,
+    private_key: SecretStr,
+    client_email: SecretStr
+) -> Dict[str, str]:
+    """Build the service account dictionary once per distinct set of secrets."""
+    return {
+        "type": "service_account",
+        "project_id": project_id.get_secret_value(),
+        "private_key": private_key.get_secret_value(),
+        "client_email": client_email.get_secret_value(),
+    }
 
 # Create settings instance
-settings = Settings()
\ No newline at end of file
+settings = Settings()
+
+def get_firebase_credentials() -> Dict[str, str]:
+    """
+    Returns the cached Firebase credentials for the global settings instance.
+
+    Returns:
+        Dict[str, str]: Firebase service account credentials
+    """
+    return settings.get_firebase_credentials()
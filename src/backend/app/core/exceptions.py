@@ -3,6 +3,7 @@ from datetime import datetime
 import uuid
 import logging
 from typing import Optional, Dict, Any
+import msgspec  # msgspec v0.18+
 
 # FastAPI version: 0.100+
 
@@ -22,6 +23,15 @@ ERROR_MESSAGES = {
     'NETWORK_ERROR': 'Network communication error - Please check your connection'
 }
 
+class ErrorPayload(msgspec.Struct, omit_defaults=True):
+    """Typed error response body, encoded directly by msgspec in the API error handlers."""
+    status: str
+    code: int
+    message: str
+    correlation_id: str
+    timestamp: str
+    details: Optional[Dict[str, Any]] = None
+
 class BaseAppException(HTTPException):
     """
     Base exception class for all application-specific exceptions.
@@ -107,6 +117,23 @@ class BaseAppException(HTTPException):
             
         return error_dict
 
+    @property
+    def payload(self) -> ErrorPayload:
+        """
+        Error response body as a msgspec struct, equivalent to to_dict().
+
+        Returns:
+            ErrorPayload: Standardized error response payload
+        """
+        return ErrorPayload(
+            status='error',
+            code=self.error_code,
+            message=self.message,
+            correlation_id=self.correlation_id,
+            timestamp=self.timestamp,
+            details=self.details or None
+        )
+
     def log_error(self) -> None:
         """
         Log error details to the monitoring system with context.
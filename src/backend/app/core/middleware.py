@@ -1,8 +1,12 @@
 # Python 3.11+
+import asyncio
 import time
 import uuid
-from typing import Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, Optional, Tuple
 from fastapi import FastAPI
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from starlette.requests import Request
 from starlette.responses import Response
 from prometheus_client import Counter, Histogram
@@ -12,6 +16,7 @@ from app.core.rate_limiter import RateLimiter
 from app.core.logging import get_logger
 from app.core.security import verify_token
 from app.core.exceptions import AuthenticationError
+from app.services.redis_service import API_LATENCY_HISTOGRAM_KEY, latency_bucket
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -19,6 +24,13 @@ logger = get_logger(__name__)
 # Define public paths that don't require authentication
 PUBLIC_PATHS = ['/api/v1/auth/login', '/api/v1/auth/register', '/api/v1/health']
 
+# Pre-encoded tracing header names (ASGI headers are raw lowercase bytes)
+HEADER_REQUEST_ID = b'x-request-id'
+HEADER_PROCESS_TIME = b'x-process-time-us'
+
+# Latency samples are counted in process and flushed to Redis at most this often
+LATENCY_FLUSH_INTERVAL = 5.0  # seconds
+
 # Initialize Prometheus metrics
 REQUEST_COUNTER = Counter(
     'http_requests_total',
@@ -232,4 +244,182 @@ class PerformanceMiddleware:
                     'correlation_id': correlation_id
                 }
             )
-            raise
\ No newline at end of file
+            raise
+
+class SelectiveAuthMiddleware:
+    """
+    Pure ASGI guard that skips authentication for exempt path prefixes such as
+    API docs and health checks.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        auth_middleware: Callable[..., ASGIApp],
+        exempt_paths: Tuple[str, ...],
+        **auth_options: Any
+    ) -> None:
+        """
+        Initialize selective authentication middleware.
+
+        Args:
+            app: Downstream ASGI application
+            auth_middleware: Authentication middleware class to wrap
+            exempt_paths: Path prefixes served without authentication
+            **auth_options: Keyword arguments for the authentication middleware
+        """
+        self.app = app
+        self.auth_app = auth_middleware(app, **auth_options)
+        self.exempt_paths = tuple(exempt_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Route exempt HTTP paths straight to the application, everything else through auth.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope['type'] == 'http' and scope['path'].startswith(self.exempt_paths):
+            await self.app(scope, receive, send)
+            return
+        await self.auth_app(scope, receive, send)
+
+class RequestIDMiddleware:
+    """
+    Pure ASGI middleware that propagates or assigns an X-Request-ID header.
+    Avoids the per-request task and Request/Response objects of BaseHTTPMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Initialize request ID middleware.
+
+        Args:
+            app: Downstream ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Echo the client's request ID, or a generated one, on the response.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        request_id = next(
+            (value for name, value in scope['headers'] if name == HEADER_REQUEST_ID),
+            None
+        ) or uuid.uuid4().hex.encode()
+
+        async def send_with_request_id(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                message.setdefault('headers', []).append((HEADER_REQUEST_ID, request_id))
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
+
+class ProcessTimeMiddleware:
+    """
+    Pure ASGI middleware that reports handler latency in microseconds in an
+    X-Process-Time-Us header and, given a Redis client, counts it in the API
+    latency histogram.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        redis: Optional[Redis] = None,
+        histogram_key: str = API_LATENCY_HISTOGRAM_KEY,
+        flush_interval: float = LATENCY_FLUSH_INTERVAL
+    ) -> None:
+        """
+        Initialize process time middleware.
+
+        Args:
+            app: Downstream ASGI application
+            redis: Async Redis client holding the latency histogram
+            histogram_key: Redis hash key of the latency histogram
+            flush_interval: Seconds between histogram flushes to Redis
+        """
+        self.app = app
+        self.redis = redis
+        self.histogram_key = histogram_key
+        self.flush_interval = flush_interval
+        self._pending: Dict[int, int] = {}
+        self._last_flush = time.monotonic()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Add the elapsed time in microseconds when the response starts.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        elapsed_us = None
+
+        async def send_with_process_time(message: Message) -> None:
+            nonlocal elapsed_us
+            if message['type'] == 'http.response.start':
+                elapsed_us = (time.perf_counter_ns() - start_ns) // 1000
+                message.setdefault('headers', []).append(
+                    (HEADER_PROCESS_TIME, str(elapsed_us).encode('ascii'))
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_process_time)
+
+        if self.redis is not None and elapsed_us is not None:
+            self._record(latency_bucket(elapsed_us / 1000))
+
+    def _record(self, bucket: int) -> None:
+        """
+        Count a sample locally and start a background flush once the interval elapses.
+
+        Args:
+            bucket: Latency histogram bucket index
+        """
+        self._pending[bucket] = self._pending.get(bucket, 0) + 1
+
+        now = time.monotonic()
+        if now - self._last_flush < self.flush_interval:
+            return
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+
+        batch, self._pending = self._pending, {}
+        self._last_flush = now
+        self._flush_task = asyncio.create_task(self._flush(batch))
+
+    async def _flush(self, batch: Dict[int, int]) -> None:
+        """
+        Add a batch of bucket counts to the Redis histogram in one round-trip.
+
+        Args:
+            batch: Bucket index to sample count
+        """
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for bucket, count in batch.items():
+                pipe.hincrby(self.histogram_key, bucket, count)
+            await pipe.execute()
+        except RedisError as e:
+            # Keep the samples for the next flush rather than dropping them
+            for bucket, count in batch.items():
+                self._pending[bucket] = self._pending.get(bucket, 0) + count
+            logger.warning("Latency histogram flush failed", extra={'error': str(e)})
@@ -1,4 +1,5 @@
 # Python 3.11+
+import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 import uuid
@@ -120,6 +121,20 @@ def get_password_hash(password: str) -> str:
     )
     return hashed
 
+async def hash_password(password: str) -> str:
+    """
+    Hash a password in a worker thread so Argon2 does not block the event loop.
+
+    Async request paths must use this instead of calling get_password_hash directly.
+
+    Args:
+        password: Plain text password to hash
+
+    Returns:
+        str: Hashed password
+    """
+    return await asyncio.to_thread(get_password_hash, password)
+
 def create_access_token(
     data: Dict[str, Any],
     expires_delta: Optional[timedelta] = None,
@@ -0,0 +1,10 @@
+"""
+Database access package providing the shared SQLAlchemy engine used by
+scripts and Alembic migrations.
+
+Version: Python 3.11+
+"""
+
+from app.db.engine import create_db_engine, get_engine
+
+__all__ = ["create_db_engine", "get_engine"]
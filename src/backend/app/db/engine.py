@@ -0,0 +1,61 @@
+# Python 3.11+
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from sqlalchemy import create_engine  # sqlalchemy v2.0+
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+# Connection pool settings
+POOL_SIZE = 5
+MAX_OVERFLOW = 10
+POOL_RECYCLE = 1800  # 30 minutes, below typical server idle timeouts
+
+# TCP keepalives so idle pooled connections are not silently dropped
+KEEPALIVE_ARGS = {
+    'keepalives': 1,
+    'keepalives_idle': 60,
+    'keepalives_interval': 15,
+    'keepalives_count': 4
+}
+
+def create_db_engine(
+    url: Optional[str] = None,
+    connect_args: Optional[Dict[str, Any]] = None,
+    **overrides: Any
+) -> Engine:
+    """
+    Builds a new SQLAlchemy engine with the shared pool and keepalive tuning.
+
+    Args:
+        url: Database URL, defaults to settings.DATABASE_URL
+        connect_args: DBAPI connect arguments merged over the keepalive defaults
+        **overrides: create_engine keyword arguments replacing the shared defaults
+
+    Returns:
+        Engine: Newly created SQLAlchemy engine
+    """
+    options: Dict[str, Any] = {
+        'pool_size': POOL_SIZE,
+        'max_overflow': MAX_OVERFLOW,
+        'pool_pre_ping': True,
+        'pool_recycle': POOL_RECYCLE,
+        'echo': settings.DEBUG,
+        'connect_args': {**KEEPALIVE_ARGS, **(connect_args or {})}
+    }
+    options.update(overrides)
+    return create_engine(url or settings.DATABASE_URL, **options)
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """
+    Returns the process-wide SQLAlchemy engine, creating it on first use.
+
+    Connections are health-checked on checkout and recycled periodically so
+    scripts never pick up a stale socket.
+
+    Returns:
+        Engine: Shared SQLAlchemy engine bound to settings.DATABASE_URL
+    """
+    return create_db_engine()
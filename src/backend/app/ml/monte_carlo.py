@@ -1,5 +1,5 @@
 # Python 3.11+
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
 import numpy as np  # numpy v1.24+
 import pandas as pd  # pandas v2.0+
 from scipy.stats import norm  # scipy v1.9+
@@ -70,7 +70,7 @@ class MonteCarloSimulator:
 
     def __init__(
         self,
-        random_seed: Optional[int] = None,
+        random_seed: Optional[Union[int, np.random.SeedSequence]] = None,
         n_processes: int = MAX_PARALLEL_PROCESSES,
         cache_enabled: bool = CACHE_ENABLED
     ) -> None:
@@ -78,13 +78,17 @@ class MonteCarloSimulator:
         Initialize Monte Carlo simulator with required components.
 
         Args:
-            random_seed: Seed for random number generation
+            random_seed: Seed or SeedSequence for random number generation
             n_processes: Number of parallel processes to use
             cache_enabled: Whether to use Redis caching
         """
         self._preprocessor = DataPreprocessor()
         self._redis_service = RedisService()
-        self._rng = np.random.default_rng(random_seed)
+        self._seed_sequence = (
+            random_seed if isinstance(random_seed, np.random.SeedSequence)
+            else np.random.SeedSequence(random_seed)
+        )
+        self._rng = np.random.default_rng(self._seed_sequence)
         self._cache_enabled = cache_enabled
         self._process_pool = Pool(processes=n_processes)
         self._logger = logger
@@ -93,7 +97,8 @@ class MonteCarloSimulator:
         self,
         player_ids: List[str],
         n_simulations: int = DEFAULT_N_SIMULATIONS,
-        force_refresh: bool = False
+        force_refresh: bool = False,
+        seed_sequence: Optional[np.random.SeedSequence] = None
     ) -> Dict[str, Any]:
         """
         Simulate lineup performance using parallel Monte Carlo methods.
@@ -102,6 +107,8 @@ class MonteCarloSimulator:
             player_ids: List of player IDs in lineup
             n_simulations: Number of simulations to run
             force_refresh: Whether to bypass cache
+            seed_sequence: Optional SeedSequence making this call reproducible;
+                defaults to streams spawned from the simulator's seed
 
         Returns:
             Dict containing simulation results and confidence intervals
@@ -124,11 +131,17 @@ class MonteCarloSimulator:
             # Split simulations across processes
             chunk_size = n_simulations // MAX_PARALLEL_PROCESSES
             simulation_chunks = [chunk_size] * MAX_PARALLEL_PROCESSES
+
+            # Give each chunk an independent random stream
+            chunk_seeds = (seed_sequence or self._seed_sequence).spawn(len(simulation_chunks))
             
             # Run parallel simulations
             simulation_results = await self._parallel_simulate(
                 simulation_func=self._simulate_single_lineup,
-                data_chunks=[(player_data, chunk) for chunk in simulation_chunks]
+                data_chunks=[
+                    (player_data, chunk, chunk_seed)
+                    for chunk, chunk_seed in zip(simulation_chunks, chunk_seeds)
+                ]
             )
 
             # Aggregate results
@@ -201,7 +214,8 @@ class MonteCarloSimulator:
     def _simulate_single_lineup(
         self,
         player_data: List[Dict],
-        n_simulations: int
+        n_simulations: int,
+        seed_sequence: Optional[np.random.SeedSequence] = None
     ) -> np.ndarray:
         """
         Simulate single lineup performance.
@@ -209,11 +223,14 @@ class MonteCarloSimulator:
         Args:
             player_data: List of preprocessed player data
             n_simulations: Number of simulations to run
+            seed_sequence: Optional SeedSequence for an independent random stream;
+                defaults to the simulator's generator
 
         Returns:
             Array of simulation results
         """
         try:
+            rng = self._rng if seed_sequence is None else np.random.default_rng(seed_sequence)
             results = np.zeros(n_simulations)
             for i in range(n_simulations):
                 player_points = []
@@ -221,7 +238,7 @@ class MonteCarloSimulator:
                     # Generate random performance based on historical distribution
                     mean_points = np.mean(player['data']['points'])
                     std_points = np.std(player['data']['points'])
-                    points = self._rng.normal(mean_points, std_points)
+                    points = rng.normal(mean_points, std_points)
                     player_points.append(max(0, points))  # No negative points
                 results[i] = sum(player_points)
             return results
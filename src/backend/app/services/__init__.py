@@ -8,10 +8,14 @@ Version: 1.0.0
 import logging
 from typing import Dict, Optional
 
+import redis.asyncio as redis
+
 # Internal service imports
 from app.services.espn_service import ESPNService
 from app.services.gpt_service import GPTService
-from app.services.firebase_service import FirebaseService
+from app.services.firebase_service import FirebaseService, close_auth_limiter
+from app.services.sportradar_service import SportradarService
+from app.core.config import settings
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -20,6 +24,7 @@ logger = logging.getLogger(__name__)
 _espn_service: Optional[ESPNService] = None
 _gpt_service: Optional[GPTService] = None
 _firebase_service: Optional[FirebaseService] = None
+_sportradar_service: Optional[SportradarService] = None
 
 async def initialize_services() -> bool:
     """
@@ -58,7 +63,7 @@ async def cleanup_services() -> None:
     Performs graceful cleanup of all initialized services.
     Ensures proper resource release and connection closure.
     """
-    global _espn_service, _gpt_service, _firebase_service
+    global _espn_service, _gpt_service, _firebase_service, _sportradar_service
     
     try:
         # Cleanup Firebase service
@@ -75,6 +80,14 @@ async def cleanup_services() -> None:
         if _gpt_service:
             await _gpt_service.__aexit__(None, None, None)
             _gpt_service = None
+
+        # Cleanup Sportradar service
+        if _sportradar_service:
+            await _sportradar_service.aclose()
+            _sportradar_service = None
+
+        # Close the shared token verification limiter
+        await close_auth_limiter()
             
         logger.info("All services cleaned up successfully")
         
@@ -124,14 +137,34 @@ def get_gpt_service() -> GPTService:
         raise RuntimeError("GPT service not initialized")
     return _gpt_service
 
+def get_sportradar_service() -> SportradarService:
+    """
+    Returns the shared Sportradar service instance, creating it on first use.
+    Sharing one instance keeps its HTTP connection pool warm across requests,
+    while the Redis-backed cache is shared across workers.
+
+    Returns:
+        SportradarService: Shared Sportradar service
+    """
+    global _sportradar_service
+
+    if not _sportradar_service:
+        # Binary client: cached payloads are compressed and must not be decoded
+        _sportradar_service = SportradarService(
+            redis_client=redis.from_url(settings.REDIS_URL, decode_responses=False)
+        )
+    return _sportradar_service
+
 # Export service classes and initialization function
 __all__ = [
     'ESPNService',
     'GPTService', 
     'FirebaseService',
+    'SportradarService',
     'initialize_services',
     'cleanup_services',
     'get_firebase_service',
     'get_espn_service',
-    'get_gpt_service'
+    'get_gpt_service',
+    'get_sportradar_service'
 ]
\ No newline at end of file
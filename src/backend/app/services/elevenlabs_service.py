@@ -20,6 +20,7 @@ DEFAULT_SIMILARITY_BOOST = 0.75
 VOICE_GENERATION_TIMEOUT = 10
 MAX_RETRIES = 3
 BACKOFF_MULTIPLIER = 1
+MAX_CONNECTIONS = 20  # Concurrent requests per client, e.g. batched generation
 
 def generate_voice_id(prefix: str) -> str:
     """
@@ -46,6 +47,7 @@ class ElevenLabsService:
         self._client = httpx.AsyncClient(
             base_url=ELEVEN_LABS_API_BASE,
             timeout=VOICE_GENERATION_TIMEOUT,
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS),
             headers={
                 'xi-api-key': settings.ELEVEN_LABS_API_KEY.get_secret_value(),
                 'Content-Type': 'application/json'
@@ -94,12 +96,11 @@ class ElevenLabsService:
             logger.debug(f"Generating voice for text: {request.text[:50]}...")
             
             # Call Eleven Labs API with retry mechanism
-            async with self._client as client:
-                response = await client.post(
-                    f'/text-to-speech/{request.voice_id}',
-                    json=payload
-                )
-                response.raise_for_status()
+            response = await self._client.post(
+                f'/text-to-speech/{request.voice_id}',
+                json=payload
+            )
+            response.raise_for_status()
             
             # Upload audio content to S3 with metadata
             audio_data = response.content
@@ -167,9 +168,8 @@ class ElevenLabsService:
                 return list(self._voice_cache.values())
             
             # Fetch voices from API
-            async with self._client as client:
-                response = await client.get('/voices')
-                response.raise_for_status()
+            response = await self._client.get('/voices')
+            response.raise_for_status()
                 
             voices = response.json()['voices']
             
@@ -207,9 +207,8 @@ class ElevenLabsService:
                 return self._settings_cache[voice_id]
             
             # Fetch settings from API
-            async with self._client as client:
-                response = await client.get(f'/voices/{voice_id}/settings')
-                response.raise_for_status()
+            response = await self._client.get(f'/voices/{voice_id}/settings')
+            response.raise_for_status()
                 
             settings = response.json()
             
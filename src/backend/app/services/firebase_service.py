@@ -2,8 +2,11 @@
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 import asyncio
+from contextlib import asynccontextmanager
 from functools import wraps
 import json
+import time
+import uuid
 
 # External imports - version pinned for stability
 import firebase_admin  # firebase-admin v6.0+
@@ -12,6 +15,8 @@ from google.cloud.firestore_v1 import AsyncClient  # google-cloud-firestore v2.0
 from google.cloud.firestore_v1.base import DocumentSnapshot
 from google.oauth2 import credentials as google_creds  # google-auth v2.0+
 from cachetools import TTLCache  # cachetools v5.0+
+from redis.asyncio import Redis  # redis v4.6+
+from redis.exceptions import RedisError
 
 # Internal imports
 from app.core.config import settings, get_firebase_credentials
@@ -26,6 +31,109 @@ from app.core.exceptions import (
 # Initialize logger with correlation ID support
 logger = get_logger(__name__)
 
+# Cluster-wide cap on concurrent Firebase token verifications
+AUTH_CONCURRENCY_KEY = "fb-auth"
+AUTH_CONCURRENCY_LIMIT = 50
+AUTH_CONCURRENCY_WINDOW = 10  # Seconds before an unreleased slot expires
+
+# Sorted-set semaphore: drop expired holders, then admit the caller if a slot is free.
+# KEYS[1] = semaphore key; ARGV = now, window, limit, holder id, key ttl
+CONCURRENCY_ACQUIRE_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', tonumber(ARGV[1]) - tonumber(ARGV[2]))
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[3]) then
+    redis.call('ZADD', KEYS[1], ARGV[1], ARGV[4])
+    redis.call('EXPIRE', KEYS[1], ARGV[5])
+    return 1
+end
+return 0
+"""
+
+class ConcurrencyLimiter:
+    """
+    Redis sorted-set semaphore bounding concurrent calls across all workers.
+    """
+
+    def __init__(self, redis: Redis, key: str, limit: int, window: int) -> None:
+        """
+        Initialize concurrency limiter.
+
+        Args:
+            redis: Async Redis client holding the semaphore
+            key: Redis key of the semaphore sorted set
+            limit: Maximum concurrent holders
+            window: Seconds after which an unreleased slot expires
+        """
+        self.key = key
+        self.limit = limit
+        self.window = window
+        self._redis = redis
+        self._acquire = redis.register_script(CONCURRENCY_ACQUIRE_SCRIPT)
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        Hold a semaphore slot for the duration of the block.
+
+        Raises:
+            RateLimitError: If every slot is taken
+        """
+        holder_id = uuid.uuid4().hex
+        try:
+            acquired = await self._acquire(
+                keys=[self.key],
+                args=[time.time(), self.window, self.limit, holder_id, self.window * 2]
+            )
+        except RedisError as e:
+            # Fail open: the limiter protects Firebase, it must not take authentication down
+            logger.warning("Concurrency limiter unavailable", extra={"error": str(e)})
+            yield
+            return
+
+        if not acquired:
+            raise RateLimitError(
+                message="Too many concurrent requests",
+                details={"limit": self.limit}
+            )
+
+        try:
+            yield
+        finally:
+            try:
+                await self._redis.zrem(self.key, holder_id)
+            except RedisError as e:
+                logger.warning("Concurrency limiter release failed", extra={"error": str(e)})
+
+    async def close(self) -> None:
+        """Close the Redis client holding the semaphore."""
+        await self._redis.close()
+
+# Process-wide token verification limiter shared by every FirebaseService
+_auth_limiter: Optional[ConcurrencyLimiter] = None
+
+def get_auth_limiter() -> ConcurrencyLimiter:
+    """
+    Returns the shared token verification limiter, creating it on first use.
+
+    Returns:
+        ConcurrencyLimiter: Limiter backed by a single Redis client per process
+    """
+    global _auth_limiter
+    if _auth_limiter is None:
+        _auth_limiter = ConcurrencyLimiter(
+            Redis.from_url(settings.REDIS_URL),
+            key=AUTH_CONCURRENCY_KEY,
+            limit=AUTH_CONCURRENCY_LIMIT,
+            window=AUTH_CONCURRENCY_WINDOW
+        )
+    return _auth_limiter
+
+async def close_auth_limiter() -> None:
+    """Close the shared token verification limiter's Redis client, if created."""
+    global _auth_limiter
+    if _auth_limiter is not None:
+        await _auth_limiter.close()
+        _auth_limiter = None
+
 def rate_limit(limit: int, period: int = 60):
     """
     Rate limiting decorator for Firebase operations.
@@ -155,12 +263,15 @@ class FirebaseService:
             if cached_claims := self._cache["auth"].get(cache_key):
                 return cached_claims
             
-            # Verify token with Firebase
-            decoded_token = auth.verify_id_token(
-                token,
-                check_revoked=True,
-                app=self._app
-            )
+            # Verify token with Firebase off the event loop, holding a semaphore slot
+            # only for the call
+            async with get_auth_limiter().slot():
+                decoded_token = await asyncio.to_thread(
+                    auth.verify_id_token,
+                    token,
+                    check_revoked=True,
+                    app=self._app
+                )
             
             # Validate token claims
             if not decoded_token.get("uid"):
@@ -171,6 +282,8 @@ class FirebaseService:
             
             return decoded_token
             
+        except RateLimitError:
+            raise
         except auth.RevokedIdTokenError:
             raise AuthenticationError(
                 message="Token has been revoked",
@@ -1,10 +1,11 @@
 # Python 3.11+
 import redis  # redis v4.5+
-import json
+import orjson  # orjson v3.9+
 import asyncio
 from tenacity import retry, stop_after_attempt, wait_exponential  # tenacity v8.0+
-from typing import Any, Optional, Callable
+from typing import Any, Dict, Optional, Callable, List, Sequence
 from functools import wraps
+import math
 import time
 
 from app.core.config import settings
@@ -29,6 +30,22 @@ REDIS_RETRY_OPTIONS = {
     'backoff': 2
 }
 
+# orjson encoding options; numpy values and non-str dict keys are serialized natively
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Redis hash holding the API latency histogram (bucket index -> request count)
+API_LATENCY_HISTOGRAM_KEY = 'api_latency_histogram'
+
+# Latency histogram buckets grow geometrically, bounding relative error per bucket
+LATENCY_BUCKET_GROWTH = 1.1
+_LOG_LATENCY_BUCKET_GROWTH = math.log(LATENCY_BUCKET_GROWTH)
+
+def latency_bucket(latency_ms: float) -> int:
+    """Return the histogram bucket index k such that latency_ms <= LATENCY_BUCKET_GROWTH ** k."""
+    if latency_ms <= 1.0:
+        return 0
+    return math.ceil(math.log(latency_ms) / _LOG_LATENCY_BUCKET_GROWTH)
+
 def monitor(func):
     """Decorator for monitoring Redis operations with metrics and logging."""
     @wraps(func)
@@ -74,10 +91,14 @@ class RedisService:
             # Initialize metrics tracking
             self._metrics = {
                 'get': {'success': 0, 'errors': 0, 'latency': []},
+                'get_many': {'success': 0, 'errors': 0, 'latency': []},
                 'set': {'success': 0, 'errors': 0, 'latency': []},
                 'delete': {'success': 0, 'errors': 0, 'latency': []},
                 'publish': {'success': 0, 'errors': 0, 'latency': []},
-                'subscribe': {'success': 0, 'errors': 0, 'latency': []}
+                'subscribe': {'success': 0, 'errors': 0, 'latency': []},
+                'pop_histogram': {'success': 0, 'errors': 0, 'latency': []},
+                'set_hash': {'success': 0, 'errors': 0, 'latency': []},
+                'get_hash_field': {'success': 0, 'errors': 0, 'latency': []}
             }
             
             self._healthy = True
@@ -117,7 +138,7 @@ class RedisService:
                 result = self._client.get(key)
 
             if result:
-                return json.loads(result)
+                return orjson.loads(result)
             return None
 
         except redis.RedisError as e:
@@ -125,6 +146,39 @@ class RedisService:
             logger.error(f"Redis get operation failed for key {key}: {str(e)}")
             raise IntegrationError(f"Redis get operation failed: {str(e)}")
 
+    @retry(
+        stop=stop_after_attempt(REDIS_RETRY_OPTIONS['max_attempts']),
+        wait=wait_exponential(multiplier=REDIS_RETRY_OPTIONS['delay'], min=1, max=10)
+    )
+    @monitor
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        """Retrieve several cached values with a single MGET round-trip.
+        
+        Args:
+            keys: Cache keys to retrieve
+            
+        Returns:
+            Cached data for each key in order, None where a key does not exist
+            
+        Raises:
+            IntegrationError: If Redis operation fails
+        """
+        try:
+            if not self._healthy:
+                raise IntegrationError("Redis service is unhealthy")
+
+            if not keys:
+                return []
+
+            results = self._client.mget(keys)
+
+            return [orjson.loads(result) if result else None for result in results]
+
+        except redis.RedisError as e:
+            self._healthy = False
+            logger.error(f"Redis get_many operation failed for keys {list(keys)}: {str(e)}")
+            raise IntegrationError(f"Redis get_many operation failed: {str(e)}")
+
     @retry(
         stop=stop_after_attempt(REDIS_RETRY_OPTIONS['max_attempts']),
         wait=wait_exponential(multiplier=REDIS_RETRY_OPTIONS['delay'], min=1, max=10)
@@ -149,7 +203,7 @@ class RedisService:
             if not self._healthy:
                 raise IntegrationError("Redis service is unhealthy")
 
-            serialized_value = json.dumps(value)
+            serialized_value = orjson.dumps(value, option=ORJSON_OPTIONS)
             
             if use_pipeline:
                 with self._client.pipeline() as pipe:
@@ -165,6 +219,83 @@ class RedisService:
             logger.error(f"Redis set operation failed for key {key}: {str(e)}")
             raise IntegrationError(f"Redis set operation failed: {str(e)}")
 
+    @retry(
+        stop=stop_after_attempt(REDIS_RETRY_OPTIONS['max_attempts']),
+        wait=wait_exponential(multiplier=REDIS_RETRY_OPTIONS['delay'], min=1, max=10)
+    )
+    @monitor
+    async def set_hash(self, key: str, mapping: Dict[str, Any], ttl: int) -> bool:
+        """Cache a dict as a Redis hash with one serialized value per field.
+        
+        Fields can then be read individually with get_hash_field instead of
+        deserializing the whole dict.
+        
+        Args:
+            key: Cache key
+            mapping: Field names mapped to data to cache
+            ttl: Time-to-live in seconds
+            
+        Returns:
+            Success status
+            
+        Raises:
+            IntegrationError: If Redis operation fails
+        """
+        try:
+            if not self._healthy:
+                raise IntegrationError("Redis service is unhealthy")
+
+            serialized_mapping = {
+                field: orjson.dumps(value, option=ORJSON_OPTIONS)
+                for field, value in mapping.items()
+            }
+
+            # Replace the hash and set its expiry atomically in one round-trip
+            with self._client.pipeline() as pipe:
+                pipe.delete(key)
+                pipe.hset(key, mapping=serialized_mapping)
+                pipe.expire(key, ttl)
+                pipe.execute()
+
+            return True
+
+        except redis.RedisError as e:
+            self._healthy = False
+            logger.error(f"Redis set_hash operation failed for key {key}: {str(e)}")
+            raise IntegrationError(f"Redis set_hash operation failed: {str(e)}")
+
+    @retry(
+        stop=stop_after_attempt(REDIS_RETRY_OPTIONS['max_attempts']),
+        wait=wait_exponential(multiplier=REDIS_RETRY_OPTIONS['delay'], min=1, max=10)
+    )
+    @monitor
+    async def get_hash_field(self, key: str, field: str) -> Optional[Any]:
+        """Retrieve a single field of a hash cached with set_hash.
+        
+        Args:
+            key: Cache key
+            field: Field name to retrieve
+            
+        Returns:
+            Cached field data if exists, None otherwise
+            
+        Raises:
+            IntegrationError: If Redis operation fails
+        """
+        try:
+            if not self._healthy:
+                raise IntegrationError("Redis service is unhealthy")
+
+            result = self._client.hget(key, field)
+            if result:
+                return orjson.loads(result)
+            return None
+
+        except redis.RedisError as e:
+            self._healthy = False
+            logger.error(f"Redis get_hash_field operation failed for key {key}: {str(e)}")
+            raise IntegrationError(f"Redis get_hash_field operation failed: {str(e)}")
+
     @retry(
         stop=stop_after_attempt(REDIS_RETRY_OPTIONS['max_attempts']),
         wait=wait_exponential(multiplier=REDIS_RETRY_OPTIONS['delay'], min=1, max=10)
@@ -201,6 +332,41 @@ class RedisService:
             logger.error(f"Redis delete operation failed for key {key}: {str(e)}")
             raise IntegrationError(f"Redis delete operation failed: {str(e)}")
 
+    @retry(
+        stop=stop_after_attempt(REDIS_RETRY_OPTIONS['max_attempts']),
+        wait=wait_exponential(multiplier=REDIS_RETRY_OPTIONS['delay'], min=1, max=10)
+    )
+    @monitor
+    async def pop_histogram(self, key: str) -> Dict[int, int]:
+        """Atomically read and reset a latency histogram of latency_bucket sample counts.
+        
+        Args:
+            key: Histogram hash key
+            
+        Returns:
+            Mapping of bucket index to sample count since the previous pop, empty if none
+            
+        Raises:
+            IntegrationError: If Redis operation fails
+        """
+        try:
+            if not self._healthy:
+                raise IntegrationError("Redis service is unhealthy")
+
+            # HGETALL and DEL in one MULTI so no sample lands between read and reset
+            with self._client.pipeline(transaction=True) as pipe:
+                counts, _ = pipe.hgetall(key).delete(key).execute()
+
+            return {
+                int(bucket): int(count)
+                for bucket, count in counts.items()
+            }
+
+        except redis.RedisError as e:
+            self._healthy = False
+            logger.error(f"Redis pop_histogram operation failed for key {key}: {str(e)}")
+            raise IntegrationError(f"Redis pop_histogram operation failed: {str(e)}")
+
     @retry(
         stop=stop_after_attempt(REDIS_RETRY_OPTIONS['max_attempts']),
         wait=wait_exponential(multiplier=REDIS_RETRY_OPTIONS['delay'], min=1, max=10)
@@ -223,7 +389,7 @@ class RedisService:
             if not self._healthy:
                 raise IntegrationError("Redis service is unhealthy")
 
-            serialized_message = json.dumps(message)
+            serialized_message = orjson.dumps(message, option=ORJSON_OPTIONS)
             self._client.publish(channel, serialized_message)
             return True
 
@@ -255,7 +421,7 @@ class RedisService:
                 try:
                     message = self._pubsub.get_message(timeout=timeout)
                     if message and message['type'] == 'message':
-                        data = json.loads(message['data'])
+                        data = orjson.loads(message['data'])
                         await callback(data)
                 except redis.RedisError as e:
                     logger.error(f"Redis subscription error: {str(e)}")
@@ -1,11 +1,11 @@
 # Python 3.11+
 import asyncio
 import hashlib
+import random
 from typing import Optional, Dict, Any
 from uuid import UUID
 
 import httpx  # version 0.24+
-import tenacity  # version 8.2+
 import aiofiles  # version 23.1+
 from prometheus_client import Counter, Histogram  # version 0.17+
 
@@ -21,8 +21,10 @@ logger = get_logger('runwayml_service')
 # Constants
 RUNWAY_API_BASE_URL = 'https://api.runwayml.com/v1'
 RETRY_MULTIPLIER = 1.5
+MAX_RETRY_DELAY_SECONDS = 30.0
 MAX_CONTENT_SIZE = 1024 * 1024 * 100  # 100MB
 VALID_VIDEO_FORMATS = ['mp4', 'mov']
+MAX_CONNECTIONS = 20  # Concurrent requests per client, e.g. batched generation
 
 # Metrics
 VIDEO_GENERATION_REQUESTS = Counter(
@@ -45,6 +47,7 @@ class RunwayMLService:
         self._client = httpx.AsyncClient(
             base_url=RUNWAY_API_BASE_URL,
             timeout=60.0,
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS),
             verify=True,
             headers={
                 'Authorization': f'Bearer {settings.RUNWAY_ML_API_KEY.get_secret_value()}',
@@ -91,18 +94,17 @@ class RunwayMLService:
                 }
 
                 # Submit generation job
-                async with self._client as client:
-                    response = await client.post('/videos/generate', json=payload)
-                    
-                    if response.status_code != 202:
-                        raise IntegrationError(
-                            message="Failed to initiate video generation",
-                            error_code=6010,
-                            details={'status_code': response.status_code}
-                        )
+                response = await self._client.post('/videos/generate', json=payload)
 
-                    job_data = response.json()
-                    job_id = job_data['id']
+                if response.status_code != 202:
+                    raise IntegrationError(
+                        message="Failed to initiate video generation",
+                        error_code=6010,
+                        details={'status_code': response.status_code}
+                    )
+
+                job_data = response.json()
+                job_id = job_data['id']
 
                 # Track generation progress
                 progress = 0.0
@@ -111,7 +113,7 @@ class RunwayMLService:
                     await asyncio.sleep(5)
 
                 # Retrieve generated video
-                video_response = await client.get(f'/videos/{job_id}/download')
+                video_response = await self._client.get(f'/videos/{job_id}/download')
                 
                 if video_response.status_code != 200:
                     raise IntegrationError(
@@ -201,13 +203,41 @@ class RunwayMLService:
             logger.error(f"Video content validation failed: {str(e)}", exc_info=True)
             return False
 
-    @tenacity.retry(
-        stop=tenacity.stop_after_attempt(settings.RUNWAY_ML_MAX_RETRIES),
-        wait=tenacity.wait_exponential(multiplier=RETRY_MULTIPLIER)
-    )
+    @staticmethod
+    def _is_transient_status(status_code: int) -> bool:
+        """Returns True for status codes worth retrying (throttling and server errors)."""
+        return status_code == 429 or 500 <= status_code < 600
+
+    @staticmethod
+    def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """
+        Computes the delay before the next retry attempt.
+
+        Honors a numeric Retry-After header when present, otherwise falls back to
+        jittered exponential backoff so parallel polling coroutines do not retry in lockstep.
+
+        Args:
+            attempt: Zero-based attempt number
+            response: Last response received, if any
+
+        Returns:
+            float: Delay in seconds
+        """
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    return min(MAX_RETRY_DELAY_SECONDS, max(0.0, float(retry_after)))
+                except ValueError:
+                    pass
+        return min(MAX_RETRY_DELAY_SECONDS, RETRY_MULTIPLIER * 2 ** attempt) + random.random()
+
     async def track_generation_progress(self, job_id: str) -> float:
         """
         Tracks and reports video generation progress with retry mechanism.
+
+        Only transport errors, 429 and 5xx responses are retried; other client
+        errors fail immediately. The shared client stays open across attempts.
         
         Args:
             job_id: RunwayML job identifier
@@ -218,27 +248,50 @@ class RunwayMLService:
         Raises:
             IntegrationError: If progress tracking fails
         """
-        try:
-            async with self._client as client:
-                response = await client.get(f'/videos/{job_id}/progress')
-                
-                if response.status_code != 200:
+        max_retries = settings.MAX_RETRIES
+        last_error: Optional[str] = None
+
+        for attempt in range(max_retries):
+            response: Optional[httpx.Response] = None
+            try:
+                response = await self._client.get(f'/videos/{job_id}/progress')
+            except httpx.TransportError as e:
+                last_error = str(e)
+            else:
+                if response.status_code == 200:
+                    try:
+                        progress_data = response.json()
+                        progress = float(progress_data.get('progress', 0.0))
+                    except (ValueError, TypeError) as e:
+                        logger.error(f"Invalid progress payload for job {job_id}: {str(e)}")
+                        raise IntegrationError(
+                            message="Progress tracking failed",
+                            error_code=6015,
+                            details={'job_id': job_id, 'error': str(e)}
+                        )
+
+                    logger.debug(f"Generation progress for job {job_id}: {progress}%")
+                    return progress
+
+                if not self._is_transient_status(response.status_code):
                     raise IntegrationError(
                         message="Failed to fetch generation progress",
                         error_code=6014,
-                        details={'job_id': job_id}
+                        details={'job_id': job_id, 'status_code': response.status_code}
                     )
+                last_error = f"HTTP {response.status_code}"
 
-                progress_data = response.json()
-                progress = float(progress_data.get('progress', 0.0))
-                
-                logger.debug(f"Generation progress for job {job_id}: {progress}%")
-                return progress
+            if attempt < max_retries - 1:
+                delay = self._retry_delay(attempt, response)
+                logger.warning(
+                    f"Transient error tracking job {job_id} ({last_error}), "
+                    f"retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
 
-        except Exception as e:
-            logger.error(f"Progress tracking failed for job {job_id}: {str(e)}", exc_info=True)
-            raise IntegrationError(
-                message="Progress tracking failed",
-                error_code=6015,
-                details={'job_id': job_id, 'error': str(e)}
-            )
\ No newline at end of file
+        logger.error(f"Progress tracking failed for job {job_id}: {last_error}")
+        raise IntegrationError(
+            message="Progress tracking failed",
+            error_code=6015,
+            details={'job_id': job_id, 'error': last_error}
+        )
@@ -4,6 +4,7 @@ import hashlib
 from typing import Optional, Dict, Any
 import mimetypes
 from datetime import datetime, timedelta
+from types import MappingProxyType
 
 import boto3  # version 1.26+
 from botocore.config import Config
@@ -54,11 +55,11 @@ class S3Service:
 
             self._bucket_name = settings.AWS_S3_BUCKET
 
-            # Configure server-side encryption
-            self._upload_config = {
+            # Configure server-side encryption (read-only, shared by every upload)
+            self._upload_config = MappingProxyType({
                 'ServerSideEncryption': 'aws:kms',
                 'SSEKMSKeyId': settings.AWS_S3_ENCRYPTION_KEY.get_secret_value()
-            }
+            })
 
             # Configure lifecycle rules
             self._lifecycle_config = {
@@ -113,6 +114,32 @@ class S3Service:
                 details={'error': str(e)}
             )
 
+    def _build_upload_args(
+        self,
+        content_type: str,
+        md5_hash: str,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Build per-upload extra arguments on top of the shared encryption config.
+        
+        Args:
+            content_type: Content type of the object
+            md5_hash: MD5 checksum of the object body
+            metadata: Optional metadata dictionary
+            
+        Returns:
+            Upload arguments dictionary
+        """
+        upload_metadata = {'md5_hash': md5_hash}
+        if metadata:
+            upload_metadata.update(metadata)
+
+        upload_args = dict(self._upload_config)
+        upload_args['ContentType'] = content_type
+        upload_args['Metadata'] = upload_metadata
+        return upload_args
+
     def upload_file(
         self,
         file_path: str,
@@ -147,16 +174,8 @@ class S3Service:
             if not content_type:
                 content_type = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
 
-            # Prepare upload configuration
-            upload_args = {
-                **self._upload_config,
-                'ContentType': content_type,
-                'Metadata': {
-                    'md5_hash': file_hash,
-                    'upload_timestamp': datetime.utcnow().isoformat(),
-                    **(metadata or {})
-                }
-            }
+            # Prepare upload configuration (S3 records LastModified server-side)
+            upload_args = self._build_upload_args(content_type, file_hash, metadata)
 
             # Perform upload with progress monitoring
             self._client.upload_file(
@@ -203,16 +222,8 @@ class S3Service:
             # Calculate data checksum
             data_hash = hashlib.md5(data).hexdigest()
 
-            # Prepare upload configuration
-            upload_args = {
-                **self._upload_config,
-                'ContentType': content_type,
-                'Metadata': {
-                    'md5_hash': data_hash,
-                    'upload_timestamp': datetime.utcnow().isoformat(),
-                    **(metadata or {})
-                }
-            }
+            # Prepare upload configuration (S3 records LastModified server-side)
+            upload_args = self._build_upload_args(content_type, data_hash, metadata)
 
             # Upload data
             self._client.put_object(
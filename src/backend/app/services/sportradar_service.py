@@ -1,11 +1,26 @@
 # Python 3.11+
 from typing import Dict, Any, Optional, List
+import asyncio
+import logging
+import random
+import time
+from functools import partial
 import httpx  # httpx v0.24+
-from tenacity import retry, stop_after_attempt, wait_exponential  # tenacity v8.0+
-from cachetools import TTLCache  # cachetools v5.0+
+import orjson  # orjson v3.9+
+import zstandard as zstd  # zstandard v0.21+
+from redis.asyncio import Redis  # redis v4.6+
+from redis.exceptions import RedisError
+from tenacity import (  # tenacity v8.0+
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential
+)
+from cachetools import TLRUCache  # cachetools v5.0+
 from datetime import datetime
 
-from app.core.config import settings, SUPPORTED_SPORTS
+from app.core.config import settings
+from app.utils.constants import SUPPORTED_SPORTS, SUPPORTED_SPORTS_SET
 from app.utils.enums import SportType
 from app.core.exceptions import IntegrationException
 from app.core.logging import get_logger
@@ -20,63 +35,250 @@ BASE_URLS = {
     SportType.MLB: 'https://api.sportradar.us/mlb/official/v7'
 }
 
-# Cache TTL in seconds (15 minutes)
+# Pre-parsed base URLs (trailing slash so relative endpoints join under the base path)
+_BASE_URLS = {sport: httpx.URL(f"{url}/") for sport, url in BASE_URLS.items()}
+
+# Shared (Redis) cache TTL in seconds (15 minutes)
 CACHE_TTL = 900
 
+# In-process hot cache in front of Redis (entries are compressed, so it can hold more)
+L1_CACHE_MAXSIZE = 512
+L1_CACHE_TTL = 60
+
+# Per-entry TTL jitter as a fraction of the TTL (900s -> +/-60s), spreading
+# expiries of entries written in the same burst
+CACHE_TTL_JITTER = 1 / 15
+
+# Redis key namespace and payload compression level
+REDIS_KEY_PREFIX = 'sportradar:'
+COMPRESSION_LEVEL = 1
+
+# Cached payloads are stored as zstd-compressed JSON in both cache tiers, so the
+# same bytes go to Redis and only hits pay for decompression
+_COMPRESSOR = zstd.ZstdCompressor(level=COMPRESSION_LEVEL)
+_DECOMPRESSOR = zstd.ZstdDecompressor()
+
+# Resource kinds served through the shared fetch path
+PLAYER_STATS = 'player_stats'
+GAME_STATS = 'game_stats'
+TEAM_ROSTER = 'team_roster'
+
+# Precomputed cache-key prefixes and endpoint (prefix, suffix) pairs so the hot path
+# only concatenates strings
+_KEY_PREFIX = {
+    (kind, sport): f"{kind}:{sport}:"
+    for kind in (PLAYER_STATS, GAME_STATS, TEAM_ROSTER)
+    for sport in SportType
+}
+_ENDPOINT_PARTS = {
+    PLAYER_STATS: ('players/', '/profile.json'),
+    GAME_STATS: ('games/', '/summary.json'),
+    TEAM_ROSTER: ('teams/', '/profile.json')
+}
+
 # Request timeout in seconds
 REQUEST_TIMEOUT = 30
 
+# Attempts for transient connection failures, with jittered backoff bounds in seconds
+MAX_ATTEMPTS = 3
+RETRY_WAIT_MIN = 1
+RETRY_WAIT_MAX = 10
+
+# Sentinel distinguishing a cache miss from a cached falsy payload
+_MISS = object()
+
+
+def _jittered_ttl(ttl: float) -> float:
+    """Returns the TTL randomly offset by up to CACHE_TTL_JITTER of its value."""
+    spread = ttl * CACHE_TTL_JITTER
+    return ttl + random.uniform(-spread, spread)
+
+
+def _l1_expiry(_key: str, _value: Any, now: float) -> float:
+    """Time-to-use callback giving each in-process cache entry a jittered expiry."""
+    return now + _jittered_ttl(L1_CACHE_TTL)
+
+
+def _encode(data: Any) -> bytes:
+    """Serializes and compresses a payload for caching."""
+    return _COMPRESSOR.compress(orjson.dumps(data))
+
+
+def _decode(blob: bytes) -> Any:
+    """Decompresses and deserializes a cached payload."""
+    return orjson.loads(_DECOMPRESSOR.decompress(blob))
+
 class SportradarService:
     """Service class for interacting with Sportradar API endpoints with built-in caching and retry mechanisms."""
 
-    def __init__(self) -> None:
-        """Initialize Sportradar service with API key, HTTP client, and caching."""
+    def __init__(self, redis_client: Optional[Redis] = None) -> None:
+        """
+        Initialize Sportradar service with API key, HTTP client, and caching.
+
+        Args:
+            redis_client: Optional binary-safe Redis client backing the shared cache
+                across workers; closed together with the service
+        """
         self._api_key = settings.SPORTRADAR_API_KEY.get_secret_value()
-        self._client = httpx.AsyncClient(
-            timeout=REQUEST_TIMEOUT,
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
-        )
-        self._cache = TTLCache(maxsize=1000, ttl=CACHE_TTL)
+        # Created lazily so the connection pool is bound to the running event loop
+        self._client: Optional[httpx.AsyncClient] = None
+        self._redis = redis_client
+        self._cache = TLRUCache(maxsize=L1_CACHE_MAXSIZE, ttu=_l1_expiry)
         self._rate_limits = {sport: 0 for sport in SUPPORTED_SPORTS}
+        # In-flight API requests keyed by cache key, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Task] = {}
 
-    async def get_player_stats(self, player_id: str, sport_type: SportType) -> Dict[str, Any]:
+    def _get_client(self) -> httpx.AsyncClient:
         """
-        Fetches player statistics from Sportradar API with caching and retry.
+        Returns the shared HTTP client, creating it on first use.
+
+        Returns:
+            httpx.AsyncClient: Pooled client reused across requests
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                # All sports share api.sportradar.us, so one HTTP/2 connection multiplexes them
+                http2=True,
+                timeout=REQUEST_TIMEOUT,
+                # Client-level header keeps the key out of query strings and logs
+                headers={'x-api-key': self._api_key},
+                limits=httpx.Limits(
+                    max_connections=settings.SPORTRADAR_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.SPORTRADAR_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.SPORTRADAR_KEEPALIVE_EXPIRY_SECONDS
+                )
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Closes the shared HTTP and Redis clients and releases pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+    async def _get_shared(self, cache_key: str) -> Any:
+        """
+        Reads a compressed payload from the shared Redis cache.
 
         Args:
-            player_id: Unique identifier for the player
+            cache_key: Cache key without the Redis namespace
+
+        Returns:
+            Compressed payload bytes, or _MISS if absent or unavailable
+        """
+        if self._redis is None:
+            return _MISS
+
+        try:
+            raw = await self._redis.get(REDIS_KEY_PREFIX + cache_key)
+        except RedisError as e:
+            logger.warning(f"Shared cache read failed for {cache_key}: {str(e)}")
+            return _MISS
+        return _MISS if raw is None else raw
+
+    async def _set_shared(self, cache_key: str, blob: bytes) -> None:
+        """
+        Writes a compressed payload to the shared Redis cache.
+
+        Args:
+            cache_key: Cache key without the Redis namespace
+            blob: Compressed payload bytes
+        """
+        if self._redis is None:
+            return
+
+        try:
+            await self._redis.set(
+                REDIS_KEY_PREFIX + cache_key,
+                blob,
+                ex=round(_jittered_ttl(CACHE_TTL))
+            )
+        except RedisError as e:
+            logger.warning(f"Shared cache write failed for {cache_key}: {str(e)}")
+
+    async def _get_cached(self, cache_key: str) -> Any:
+        """
+        Looks up a payload in the in-process cache, then the shared cache.
+
+        Args:
+            cache_key: Cache key of the requested payload
+
+        Returns:
+            Decoded payload, or _MISS if absent or undecodable
+        """
+        # Single lookup keeps TTL bookkeeping to one pass
+        blob = self._cache.get(cache_key, _MISS)
+        if blob is _MISS:
+            blob = await self._get_shared(cache_key)
+            if blob is _MISS:
+                return _MISS
+            self._cache[cache_key] = blob
+
+        try:
+            return _decode(blob)
+        except (zstd.ZstdError, orjson.JSONDecodeError) as e:
+            # Treat corrupt or foreign-format entries as a miss; the refetch overwrites them
+            logger.warning(f"Discarding undecodable cache entry {cache_key}: {str(e)}")
+            self._cache.pop(cache_key, None)
+            return _MISS
+
+    @staticmethod
+    def _unsupported_sport(sport_type: SportType) -> IntegrationException:
+        """Builds the error raised for sport types outside SUPPORTED_SPORTS."""
+        return IntegrationException(
+            message=f"Unsupported sport type: {sport_type}",
+            error_code=6001,
+            details={"sport_type": sport_type}
+        )
+
+    async def _fetch(
+        self,
+        kind: str,
+        entity_id: str,
+        sport_type: SportType
+    ) -> Dict[str, Any]:
+        """
+        Shared cache-check, validation and dispatch path for the public getters.
+
+        Args:
+            kind: Resource kind selecting the cache-key prefix and endpoint
+            entity_id: Unique identifier of the requested entity
             sport_type: Type of sport (NFL, NBA, MLB)
 
         Returns:
-            Dict containing player statistics and cache metadata
+            Dict containing response data and cache metadata
 
         Raises:
             IntegrationException: If API request fails or returns invalid data
         """
-        cache_key = f"player_stats:{sport_type.value}:{player_id}"
-        
-        # Check cache first
-        if cache_key in self._cache:
-            logger.debug(f"Cache hit for player stats: {player_id}")
+        key_prefix = _KEY_PREFIX.get((kind, sport_type))
+        if key_prefix is None:
+            raise self._unsupported_sport(sport_type)
+        cache_key = key_prefix + entity_id
+
+        # Only supported sports are ever cached, so hits skip sport validation
+        cached_data = await self._get_cached(cache_key)
+        if cached_data is not _MISS:
+            logger.debug("Cache hit for %s: %s", kind, entity_id)
             return {
-                "data": self._cache[cache_key],
+                "data": cached_data,
                 "cached": True,
                 "timestamp": datetime.utcnow().isoformat()
             }
 
-        # Validate sport type
-        if sport_type not in SUPPORTED_SPORTS:
-            raise IntegrationException(
-                message=f"Unsupported sport type: {sport_type}",
-                error_code=6001,
-                details={"sport_type": sport_type.value}
-            )
+        # Validate sport type before spending an API call
+        if sport_type not in SUPPORTED_SPORTS_SET:
+            raise self._unsupported_sport(sport_type)
 
-        endpoint = f"/players/{player_id}/profile.json"
-        response_data = await self._make_request(endpoint, sport_type)
-
-        # Cache successful response
-        self._cache[cache_key] = response_data
+        endpoint_prefix, endpoint_suffix = _ENDPOINT_PARTS[kind]
+        response_data = await self._load(
+            cache_key,
+            endpoint_prefix + entity_id + endpoint_suffix,
+            sport_type
+        )
 
         return {
             "data": response_data,
@@ -84,50 +286,94 @@ class SportradarService:
             "timestamp": datetime.utcnow().isoformat()
         }
 
-    async def get_game_stats(self, game_id: str, sport_type: SportType) -> Dict[str, Any]:
+    async def _fetch_and_cache(self, cache_key: str, endpoint: str, sport_type: SportType) -> Any:
         """
-        Fetches game statistics from Sportradar API with caching and retry.
+        Fetches a payload from the API and writes it to both cache tiers.
 
         Args:
-            game_id: Unique identifier for the game
+            cache_key: Cache key of the requested payload
+            endpoint: API endpoint path
             sport_type: Type of sport (NFL, NBA, MLB)
 
         Returns:
-            Dict containing game statistics and cache metadata
+            API response data
+        """
+        response_data = await self._make_request(endpoint, sport_type)
+        blob = _encode(response_data)
+        self._cache[cache_key] = blob
+        await self._set_shared(cache_key, blob)
+        return response_data
+
+    def _release_inflight(self, cache_key: str, task: asyncio.Task) -> None:
+        """
+        Drops a finished fetch from the in-flight table.
+
+        Args:
+            cache_key: Cache key of the fetched payload
+            task: Completed fetch task
+        """
+        self._inflight.pop(cache_key, None)
+        # Mark a failure as retrieved so it is not reported as never awaited
+        if not task.cancelled():
+            task.exception()
+
+    async def _load(self, cache_key: str, endpoint: str, sport_type: SportType) -> Any:
+        """
+        Fetches and caches a payload, coalescing concurrent misses for the same key.
+
+        The API request runs in a detached task shared by every caller, so a burst
+        on an expired key costs a single outbound request and one caller being
+        cancelled does not cancel the fetch for the others.
+
+        Args:
+            cache_key: Cache key of the requested payload
+            endpoint: API endpoint path
+            sport_type: Type of sport (NFL, NBA, MLB)
+
+        Returns:
+            API response data
 
         Raises:
             IntegrationException: If API request fails or returns invalid data
         """
-        cache_key = f"game_stats:{sport_type.value}:{game_id}"
-        
-        # Check cache first
-        if cache_key in self._cache:
-            logger.debug(f"Cache hit for game stats: {game_id}")
-            return {
-                "data": self._cache[cache_key],
-                "cached": True,
-                "timestamp": datetime.utcnow().isoformat()
-            }
+        inflight = self._inflight.get(cache_key)
+        if inflight is None:
+            inflight = asyncio.create_task(self._fetch_and_cache(cache_key, endpoint, sport_type))
+            self._inflight[cache_key] = inflight
+            inflight.add_done_callback(partial(self._release_inflight, cache_key))
+        return await asyncio.shield(inflight)
 
-        # Validate sport type
-        if sport_type not in SUPPORTED_SPORTS:
-            raise IntegrationException(
-                message=f"Unsupported sport type: {sport_type}",
-                error_code=6001,
-                details={"sport_type": sport_type.value}
-            )
+    async def get_player_stats(self, player_id: str, sport_type: SportType) -> Dict[str, Any]:
+        """
+        Fetches player statistics from Sportradar API with caching and retry.
 
-        endpoint = f"/games/{game_id}/summary.json"
-        response_data = await self._make_request(endpoint, sport_type)
+        Args:
+            player_id: Unique identifier for the player
+            sport_type: Type of sport (NFL, NBA, MLB)
 
-        # Cache successful response
-        self._cache[cache_key] = response_data
+        Returns:
+            Dict containing player statistics and cache metadata
 
-        return {
-            "data": response_data,
-            "cached": False,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        Raises:
+            IntegrationException: If API request fails or returns invalid data
+        """
+        return await self._fetch(PLAYER_STATS, player_id, sport_type)
+
+    async def get_game_stats(self, game_id: str, sport_type: SportType) -> Dict[str, Any]:
+        """
+        Fetches game statistics from Sportradar API with caching and retry.
+
+        Args:
+            game_id: Unique identifier for the game
+            sport_type: Type of sport (NFL, NBA, MLB)
+
+        Returns:
+            Dict containing game statistics and cache metadata
+
+        Raises:
+            IntegrationException: If API request fails or returns invalid data
+        """
+        return await self._fetch(GAME_STATS, game_id, sport_type)
 
     async def get_team_roster(self, team_id: str, sport_type: SportType) -> Dict[str, Any]:
         """
@@ -143,44 +389,59 @@ class SportradarService:
         Raises:
             IntegrationException: If API request fails or returns invalid data
         """
-        cache_key = f"team_roster:{sport_type.value}:{team_id}"
-        
-        # Check cache first
-        if cache_key in self._cache:
-            logger.debug(f"Cache hit for team roster: {team_id}")
-            return {
-                "data": self._cache[cache_key],
-                "cached": True,
-                "timestamp": datetime.utcnow().isoformat()
-            }
+        return await self._fetch(TEAM_ROSTER, team_id, sport_type)
+
+    @retry(
+        stop=stop_after_attempt(MAX_ATTEMPTS),
+        wait=wait_random_exponential(min=RETRY_WAIT_MIN, max=RETRY_WAIT_MAX),
+        retry=retry_if_exception_type(httpx.RequestError),
+        reraise=True
+    )
+    async def _send(self, url: httpx.URL, endpoint: str, sport_type: SportType, params: Optional[Dict]) -> httpx.Response:
+        """
+        Sends a single GET request, retrying only transient connection failures.
 
-        # Validate sport type
-        if sport_type not in SUPPORTED_SPORTS:
-            raise IntegrationException(
-                message=f"Unsupported sport type: {sport_type}",
-                error_code=6001,
-                details={"sport_type": sport_type.value}
-            )
+        Args:
+            url: Fully joined request URL
+            endpoint: API endpoint path, for logging
+            sport_type: Type of sport (NFL, NBA, MLB)
+            params: Optional query parameters
 
-        endpoint = f"/teams/{team_id}/profile.json"
-        response_data = await self._make_request(endpoint, sport_type)
+        Returns:
+            httpx.Response: Successful response
 
-        # Cache successful response
-        self._cache[cache_key] = response_data
+        Raises:
+            httpx.HTTPStatusError: On non-success status (not retried)
+            httpx.RequestError: On connection failure after all attempts
+        """
+        start_time = time.monotonic()
+        response = await self._get_client().get(url, params=params)
+        duration_ms = (time.monotonic() - start_time) * 1000.0
 
-        return {
-            "data": response_data,
-            "cached": False,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        # Skip building the log record when INFO is disabled (production levels)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Sportradar API request completed",
+                extra={
+                    'endpoint': endpoint,
+                    'sport_type': sport_type,
+                    'duration_ms': duration_ms,
+                    'status_code': response.status_code
+                }
+            )
+
+        response.raise_for_status()
+        return response
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
     async def _make_request(self, endpoint: str, sport_type: SportType, params: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Makes authenticated HTTP request to Sportradar API with error handling.
 
+        Connection errors are retried with jittered backoff; HTTP status and
+        decoding errors are permanent and fail immediately.
+
         Args:
-            endpoint: API endpoint path
+            endpoint: API endpoint path relative to the sport base URL
             sport_type: Type of sport (NFL, NBA, MLB)
             params: Optional query parameters
 
@@ -190,31 +451,11 @@ class SportradarService:
         Raises:
             IntegrationException: If API request fails or returns invalid data
         """
-        base_url = BASE_URLS[sport_type]
-        url = f"{base_url}{endpoint}"
-        
-        # Add API key to parameters
-        request_params = params or {}
-        request_params['api_key'] = self._api_key
+        url = _BASE_URLS[sport_type].join(endpoint)
 
         try:
-            start_time = datetime.utcnow()
-            async with self._client as client:
-                response = await client.get(url, params=request_params)
-                duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
-
-            logger.info(
-                f"Sportradar API request completed",
-                extra={
-                    'endpoint': endpoint,
-                    'sport_type': sport_type.value,
-                    'duration_ms': duration_ms,
-                    'status_code': response.status_code
-                }
-            )
-
-            response.raise_for_status()
-            data = response.json()
+            response = await self._send(url, endpoint, sport_type, params)
+            data = orjson.loads(response.content)
 
             # Update rate limit tracking
             if 'X-Rate-Limit-Remaining' in response.headers:
@@ -229,7 +470,7 @@ class SportradarService:
                 details={
                     'status_code': e.response.status_code,
                     'endpoint': endpoint,
-                    'sport_type': sport_type.value
+                    'sport_type': sport_type
                 }
             )
         except httpx.RequestError as e:
@@ -238,15 +479,15 @@ class SportradarService:
                 error_code=6003,
                 details={
                     'endpoint': endpoint,
-                    'sport_type': sport_type.value
+                    'sport_type': sport_type
                 }
             )
-        except ValueError as e:
+        except (orjson.JSONDecodeError, ValueError) as e:
             raise IntegrationException(
                 message=f"Invalid JSON response from Sportradar API: {str(e)}",
                 error_code=6004,
                 details={
                     'endpoint': endpoint,
-                    'sport_type': sport_type.value
+                    'sport_type': sport_type
                 }
             )
\ No newline at end of file
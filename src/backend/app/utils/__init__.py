@@ -11,6 +11,7 @@ from app.utils.constants import (
     API_VERSION,
     API_PREFIX,
     SUPPORTED_SPORTS,
+    SUPPORTED_SPORTS_SET,
     RATE_LIMIT_TEAMS,
     RATE_LIMIT_PLAYERS,
     RATE_LIMIT_TRADES,
@@ -48,6 +49,7 @@ from app.utils.helpers import (
     generate_cache_key,
     get_cache_ttl,
     format_player_stats,
+    format_player_stats_batch,
     calculate_trade_risk,
     convert_platform_data,
     StatisticsCalculator
@@ -67,6 +69,7 @@ __all__ = [
     'API_VERSION',
     'API_PREFIX',
     'SUPPORTED_SPORTS',
+    'SUPPORTED_SPORTS_SET',
     'RATE_LIMIT_TEAMS',
     'RATE_LIMIT_PLAYERS',
     'RATE_LIMIT_TRADES',
@@ -101,6 +104,7 @@ __all__ = [
     'generate_cache_key',
     'get_cache_ttl',
     'format_player_stats',
+    'format_player_stats_batch',
     'calculate_trade_risk',
     'convert_platform_data',
     'StatisticsCalculator',
@@ -0,0 +1,123 @@
+"""
+Numba-compiled numeric kernels backing the hot helper calculations.
+Kernels take preconverted float64 arrays and use explicit loops, which compile
+to tight machine code without per-call NumPy dispatch overhead.
+"""
+
+import math
+
+import numpy as np
+from numba import njit  # numba v0.57+
+
+
+@njit(cache=True)
+def std_bounded(values: np.ndarray, denom: float) -> float:
+    """
+    Population standard deviation of values scaled by denom and capped at 1.0.
+
+    Args:
+        values: 1-D float64 array of observations
+        denom: Scale divisor applied to the standard deviation
+
+    Returns:
+        Scaled standard deviation in [0, 1], or 0.5 when values is empty
+    """
+    n = values.shape[0]
+    if n == 0:
+        return 0.5
+
+    mean = 0.0
+    for v in values:
+        mean += v
+    mean /= n
+
+    sq_sum = 0.0
+    for v in values:
+        d = v - mean
+        sq_sum += d * d
+
+    return min(1.0, math.sqrt(sq_sum / n) / denom)
+
+
+@njit(cache=True)
+def _clamp_unit(x: float) -> float:
+    """Clamp x to the closed interval [0, 1]."""
+    return min(1.0, max(0.0, x))
+
+
+@njit(cache=True)
+def trade_risk_total(
+    injury_risk: np.ndarray,
+    volatility: np.ndarray,
+    age: np.ndarray,
+    scarcity: np.ndarray,
+    schedule_difficulty: np.ndarray,
+    weights: np.ndarray
+) -> float:
+    """
+    Sum of weighted per-player trade risk in a single fused pass.
+
+    Every factor is clamped to [0, 1] here, so callers can pass raw values.
+
+    Args:
+        injury_risk: Per-player injury risk
+        volatility: Per-player performance volatility
+        age: Per-player age in years
+        scarcity: Per-player position scarcity
+        schedule_difficulty: Per-player schedule difficulty
+        weights: Factor weights ordered as the arguments above
+
+    Returns:
+        Total weighted risk across all players
+    """
+    total = 0.0
+    for i in range(injury_risk.shape[0]):
+        total += (
+            weights[0] * _clamp_unit(injury_risk[i])
+            + weights[1] * _clamp_unit(volatility[i])
+            + weights[2] * _clamp_unit((age[i] - 26.0) * 0.1)
+            + weights[3] * _clamp_unit(scarcity[i])
+            + weights[4] * _clamp_unit(schedule_difficulty[i])
+        )
+    return total
+
+
+@njit(cache=True)
+def mean_and_percentiles(values: np.ndarray, percentiles: np.ndarray) -> tuple:
+    """
+    Mean and linearly interpolated percentiles of values, matching np.percentile.
+
+    Uses a partial partition around the required order statistics instead of a
+    full sort.
+
+    Args:
+        values: 1-D float64 array of observations
+        percentiles: 1-D float64 array of percentiles in [0, 100]
+
+    Returns:
+        Tuple of (mean, array of percentile values); NaNs when values is empty
+    """
+    n = values.shape[0]
+    result = np.empty(percentiles.shape[0])
+    if n == 0:
+        result[:] = np.nan
+        return np.nan, result
+
+    total = 0.0
+    for v in values:
+        total += v
+
+    # Each percentile interpolates between the order statistics at floor/ceil of its rank
+    ranks = percentiles / 100.0 * (n - 1)
+    kth = np.empty(2 * ranks.shape[0], dtype=np.int64)
+    for i in range(ranks.shape[0]):
+        kth[2 * i] = int(math.floor(ranks[i]))
+        kth[2 * i + 1] = int(math.ceil(ranks[i]))
+
+    partitioned = np.partition(values, kth)
+    for i in range(ranks.shape[0]):
+        lower = partitioned[kth[2 * i]]
+        upper = partitioned[kth[2 * i + 1]]
+        result[i] = lower + (upper - lower) * (ranks[i] - kth[2 * i])
+
+    return total / n, result
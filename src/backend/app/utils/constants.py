@@ -3,7 +3,7 @@ Core constants module containing application-wide constants, configuration value
 All constants are environment-overridable and type-safe.
 """
 
-from typing import Final, List
+from typing import Final, FrozenSet, List
 from app.utils.enums import SportType  # Python 3.11+
 
 # API Configuration
@@ -12,6 +12,7 @@ API_PREFIX: Final[str] = '/api/v1'
 
 # Supported Sports Leagues
 SUPPORTED_SPORTS: Final[List[SportType]] = [SportType.NFL, SportType.NBA, SportType.MLB]
+SUPPORTED_SPORTS_SET: Final[FrozenSet[SportType]] = frozenset(SUPPORTED_SPORTS)  # O(1) membership checks
 
 # Rate Limits (requests per minute)
 RATE_LIMIT_TEAMS: Final[int] = 100  # List/manage teams
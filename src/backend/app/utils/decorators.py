@@ -5,9 +5,10 @@ import asyncio
 import datadog  # datadog v0.44.0
 from typing import Any, Callable, Dict, Optional
 from fastapi import Depends, HTTPException, Request
-from redis import Redis, RedisError
-from contextlib import asynccontextmanager
+from redis.asyncio import Redis  # redis v4.6+
+from redis.exceptions import RedisError
 
+from app.core.config import settings
 from app.core.rate_limiter import RateLimiter, CircuitBreaker
 from app.core.security import check_permissions, get_current_user, verify_token_blacklist
 from app.core.logging import get_logger, log_metric
@@ -19,17 +20,42 @@ logger = get_logger(__name__)
 CACHE_PREFIX = 'fantasy_gm:'
 RATE_LIMIT_PREFIX = 'rate_limit:'
 
-# Initialize DataDog metrics
-datadog.initialize()
-METRICS = {
-    'api.requests': datadog.Counter('api.requests'),
-    'api.latency': datadog.Histogram('api.latency'),
-    'api.errors': datadog.Counter('api.errors'),
-    'cache.hits': datadog.Counter('cache.hits'),
-    'cache.misses': datadog.Counter('cache.misses'),
-    'auth.attempts': datadog.Counter('auth.attempts'),
-    'auth.failures': datadog.Counter('auth.failures')
-}
+# Seconds to wait for the cache fill lock before computing uncached
+CACHE_LOCK_TIMEOUT = 5
+
+# Atomic fixed-window counter: INCR and set the window expiry on first hit
+RATE_LIMIT_SCRIPT = """
+local current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return current
+"""
+
+# Sentinel marking a response that has not been computed yet
+_NOT_COMPUTED = object()
+
+@functools.cache
+def _metrics() -> Dict[str, Any]:
+    """
+    Lazily initializes DataDog and its metric objects on first use.
+
+    Deferring this keeps import free of socket setup and env reads, so
+    worker forks and modules that never hit a decorator pay nothing.
+
+    Returns:
+        Dict[str, Any]: Metric objects keyed by metric name
+    """
+    datadog.initialize()
+    return {
+        'api.requests': datadog.Counter('api.requests'),
+        'api.latency': datadog.Histogram('api.latency'),
+        'api.errors': datadog.Counter('api.errors'),
+        'cache.hits': datadog.Counter('cache.hits'),
+        'cache.misses': datadog.Counter('cache.misses'),
+        'auth.attempts': datadog.Counter('auth.attempts'),
+        'auth.failures': datadog.Counter('auth.failures')
+    }
 
 def require_auth(func: Callable) -> Callable:
     """
@@ -48,12 +74,12 @@ def require_auth(func: Callable) -> Callable:
             raise HTTPException(status_code=400, detail="Request object required")
 
         try:
-            METRICS['auth.attempts'].increment()
+            _metrics()['auth.attempts'].increment()
             
             # Get and verify current user
             user = await get_current_user(request)
             if not user:
-                METRICS['auth.failures'].increment()
+                _metrics()['auth.failures'].increment()
                 raise HTTPException(status_code=401, detail="Authentication required")
 
             # Check token blacklist
@@ -74,7 +100,7 @@ def require_auth(func: Callable) -> Callable:
             return await func(*args, **kwargs)
 
         except Exception as e:
-            METRICS['auth.failures'].increment()
+            _metrics()['auth.failures'].increment()
             logger.error(
                 f"Authentication failed: {str(e)}",
                 extra={'error': str(e)}
@@ -162,24 +188,35 @@ def cache_response(ttl_seconds: int = 900, vary_by_user: bool = False):
                 cache_key_parts.append(str(request.state.user.id))
             cache_key = ':'.join(cache_key_parts)
 
+            response = _NOT_COMPUTED
             try:
-                # Check cache with stampede prevention
-                async with asynccontextmanager(redis_client.lock)(f"{cache_key}:lock"):
+                # Fast path: plain read, no lock on cache hits
+                cached_response = await redis_client.get(cache_key)
+                if cached_response:
+                    _metrics()['cache.hits'].increment()
+                    logger.debug(f"Cache hit for key: {cache_key}")
+                    return cached_response
+
+                # Miss: only one caller fills the entry (stampede prevention)
+                async with redis_client.lock(
+                    f"{cache_key}:lock",
+                    blocking_timeout=CACHE_LOCK_TIMEOUT
+                ):
+                    # Re-check, another caller may have filled it while we waited
                     cached_response = await redis_client.get(cache_key)
-                    
                     if cached_response:
-                        METRICS['cache.hits'].increment()
+                        _metrics()['cache.hits'].increment()
                         logger.debug(f"Cache hit for key: {cache_key}")
                         return cached_response
 
                     # Execute function and cache result
-                    METRICS['cache.misses'].increment()
+                    _metrics()['cache.misses'].increment()
                     response = await func(*args, **kwargs)
                     
                     await redis_client.set(
                         cache_key,
                         response,
-                        expire=ttl_seconds
+                        ex=ttl_seconds
                     )
                     
                     return response
@@ -189,7 +226,9 @@ def cache_response(ttl_seconds: int = 900, vary_by_user: bool = False):
                     f"Cache operation failed: {str(e)}",
                     extra={'cache_key': cache_key}
                 )
-                # Fallback to uncached response
+                # Fallback to uncached response without computing it twice
+                if response is not _NOT_COMPUTED:
+                    return response
                 return await func(*args, **kwargs)
 
         return wrapper
@@ -233,7 +272,7 @@ def log_execution(include_args: bool = False):
 
                 # Calculate and log execution metrics
                 duration_ms = (time.perf_counter() - start_time) * 1000
-                METRICS['api.latency'].histogram(duration_ms)
+                _metrics()['api.latency'].histogram(duration_ms)
 
                 logger.info(
                     f"Completed {func.__name__}",
@@ -247,7 +286,7 @@ def log_execution(include_args: bool = False):
                 return result
 
             except Exception as e:
-                METRICS['api.errors'].increment()
+                _metrics()['api.errors'].increment()
                 duration_ms = (time.perf_counter() - start_time) * 1000
                 
                 logger.error(
@@ -283,7 +322,8 @@ class AsyncRateLimiter:
             window_seconds: Time window in seconds
             circuit_breaker_config: Circuit breaker configuration
         """
-        self.redis_client = Redis()
+        self.redis_client = Redis.from_url(settings.REDIS_URL)
+        self._rate_script = self.redis_client.register_script(RATE_LIMIT_SCRIPT)
         self.rate_limit = rate_limit
         self.window_seconds = window_seconds
         self.circuit_breaker = CircuitBreaker(**(circuit_breaker_config or {}))
@@ -291,30 +331,23 @@ class AsyncRateLimiter:
     async def check_rate_limit(self, key: str) -> bool:
         """
         Check if request should be rate limited with circuit breaker.
+
+        Counting runs as a single Lua script (EVALSHA), so one round trip
+        replaces the lock, read and INCR/EXPIRE pipeline.
         
         Args:
             key: Rate limit key
             
         Returns:
-            bool: True if rate limited
+            bool: True if the request is within the limit
         """
         try:
             # Check circuit breaker status
             if not self.circuit_breaker.is_closed():
                 return False
 
-            async with asynccontextmanager(self.redis_client.lock)(f"{key}:lock"):
-                current = await self.redis_client.get(key) or 0
-                
-                if int(current) >= self.rate_limit:
-                    return False
-                
-                pipeline = self.redis_client.pipeline()
-                pipeline.incr(key)
-                pipeline.expire(key, self.window_seconds)
-                await pipeline.execute()
-                
-                return True
+            current = await self._rate_script(keys=[key], args=[self.window_seconds])
+            return int(current) <= self.rate_limit
 
         except RedisError as e:
             logger.error(f"Rate limit check failed: {str(e)}")
@@ -1,9 +1,9 @@
 # Python 3.11+
-from enum import Enum, unique
-from typing import List
+from enum import Enum, StrEnum, unique
+from typing import FrozenSet, Dict, Tuple
 
 @unique
-class SportType(Enum):
+class SportType(StrEnum):
     """
     Enumeration of supported sports leagues with type-safe values for platform integration.
     """
@@ -41,53 +41,54 @@ class PlayerPosition(Enum):
     DH = "DH"  # Designated Hitter
 
     @staticmethod
-    def get_positions_by_sport(sport_type: SportType) -> List['PlayerPosition']:
+    def get_positions_by_sport(sport_type: SportType) -> Tuple['PlayerPosition', ...]:
         """
-        Returns list of valid positions for a given sport type.
+        Returns the valid positions for a given sport type.
 
         Args:
             sport_type (SportType): The sport type to get positions for
 
         Returns:
-            List[PlayerPosition]: List of valid positions for the specified sport
+            Tuple[PlayerPosition, ...]: Valid positions for the specified sport
 
         Raises:
             ValueError: If invalid sport type provided
         """
-        positions_map = {
-            SportType.NFL: [
-                PlayerPosition.QB,
-                PlayerPosition.RB,
-                PlayerPosition.WR,
-                PlayerPosition.TE,
-                PlayerPosition.K,
-                PlayerPosition.DEF
-            ],
-            SportType.NBA: [
-                PlayerPosition.PG,
-                PlayerPosition.SG,
-                PlayerPosition.SF,
-                PlayerPosition.PF,
-                PlayerPosition.C
-            ],
-            SportType.MLB: [
-                PlayerPosition.P,
-                PlayerPosition.C1B,
-                PlayerPosition.C2B,
-                PlayerPosition.C3B,
-                PlayerPosition.SS,
-                PlayerPosition.OF,
-                PlayerPosition.DH
-            ]
-        }
-
-        if sport_type not in positions_map:
-            raise ValueError(f"Invalid sport type: {sport_type}")
-        
-        return positions_map[sport_type]
+        try:
+            return _POSITIONS_BY_SPORT[sport_type]
+        except KeyError:
+            raise ValueError(f"Invalid sport type: {sport_type}") from None
+
+# Positions per sport, built once at import
+_POSITIONS_BY_SPORT: Dict[SportType, Tuple[PlayerPosition, ...]] = {
+    SportType.NFL: (
+        PlayerPosition.QB,
+        PlayerPosition.RB,
+        PlayerPosition.WR,
+        PlayerPosition.TE,
+        PlayerPosition.K,
+        PlayerPosition.DEF
+    ),
+    SportType.NBA: (
+        PlayerPosition.PG,
+        PlayerPosition.SG,
+        PlayerPosition.SF,
+        PlayerPosition.PF,
+        PlayerPosition.C
+    ),
+    SportType.MLB: (
+        PlayerPosition.P,
+        PlayerPosition.C1B,
+        PlayerPosition.C2B,
+        PlayerPosition.C3B,
+        PlayerPosition.SS,
+        PlayerPosition.OF,
+        PlayerPosition.DH
+    )
+}
 
 @unique
-class TradeStatus(Enum):
+class TradeStatus(StrEnum):
     """
     Enumeration of all possible trade states for comprehensive trade lifecycle management.
     """
@@ -106,17 +107,19 @@ class TradeStatus(Enum):
         Returns:
             bool: True if status is final, False otherwise
         """
-        final_states = [
-            TradeStatus.ACCEPTED,
-            TradeStatus.REJECTED,
-            TradeStatus.CANCELLED,
-            TradeStatus.EXPIRED,
-            TradeStatus.VETOED
-        ]
-        return self in final_states
+        return self in _FINAL_STATES
+
+# Trade states that end the trade lifecycle
+_FINAL_STATES: FrozenSet[TradeStatus] = frozenset({
+    TradeStatus.ACCEPTED,
+    TradeStatus.REJECTED,
+    TradeStatus.CANCELLED,
+    TradeStatus.EXPIRED,
+    TradeStatus.VETOED
+})
 
 @unique
-class Platform(Enum):
+class Platform(StrEnum):
     """
     Enumeration of supported fantasy sports platforms with integration-specific details.
     """
@@ -130,11 +133,13 @@ class Platform(Enum):
         Returns:
             str: Base URL for platform API
         """
-        urls = {
-            Platform.ESPN: "https://fantasy.espn.com/apis/v3",
-            Platform.SLEEPER: "https://api.sleeper.app/v1"
-        }
-        return urls[self]
+        return _PLATFORM_URLS[self]
+
+# Platform API base URLs, built once at import
+_PLATFORM_URLS: Dict[Platform, str] = {
+    Platform.ESPN: "https://fantasy.espn.com/apis/v3",
+    Platform.SLEEPER: "https://api.sleeper.app/v1"
+}
 
 # Export constants for convenient access
 ALL_POSITIONS = list(PlayerPosition)
@@ -4,11 +4,13 @@ including data formatting, validation, conversion, and common calculations.
 """
 
 from datetime import datetime
-import hashlib
-import json
+from types import MappingProxyType
 import logging
-from typing import Dict, List, Any, Optional, Callable
+import sys
+from typing import Dict, List, Any, Optional, Callable, Tuple
 import numpy as np
+from cachetools import TTLCache  # v5.0+
+import xxhash  # xxhash v3.2+
 
 from app.utils.constants import (
     CACHE_TTL_PLAYER_STATS,
@@ -17,14 +19,68 @@ from app.utils.constants import (
     CACHE_TTL_VIDEO
 )
 from app.utils.enums import SportType, PlayerPosition, TradeStatus, Platform
+from app.utils._numeric_kernels import std_bounded, trade_risk_total
 
-# Global position mappings for different sports
+# Global position mappings for different sports; raw position keys are interned
+# so lookups with interned strings short-circuit on identity
 POSITION_MAPPINGS = {
-    SportType.NFL: {'QB': PlayerPosition.QB, 'RB': PlayerPosition.RB},
-    SportType.NBA: {'PG': PlayerPosition.PG, 'SG': PlayerPosition.SG},
-    SportType.MLB: {'P': PlayerPosition.P, '1B': PlayerPosition.C1B}
+    sport: {sys.intern(raw): position for raw, position in mapping.items()}
+    for sport, mapping in {
+        SportType.NFL: {'QB': PlayerPosition.QB, 'RB': PlayerPosition.RB},
+        SportType.NBA: {'PG': PlayerPosition.PG, 'SG': PlayerPosition.SG},
+        SportType.MLB: {'P': PlayerPosition.P, '1B': PlayerPosition.C1B}
+    }.items()
 }
 
+# Formatted stat fields and their defaults per sport, in output order
+NFL_STAT_FIELDS = (
+    ('passing_yards', 0),
+    ('rushing_yards', 0),
+    ('touchdowns', 0),
+    ('interceptions', 0),
+    ('completion_percentage', 0.0)
+)
+NBA_STAT_FIELDS = (
+    ('points', 0),
+    ('rebounds', 0),
+    ('assists', 0),
+    ('steals', 0),
+    ('blocks', 0)
+)
+MLB_STAT_FIELDS = (
+    ('batting_average', 0.0),
+    ('home_runs', 0),
+    ('rbis', 0),
+    ('stolen_bases', 0),
+    ('era', 0.0)
+)
+
+# Trade risk factor weights: injury history, performance volatility, age,
+# position scarcity, schedule difficulty
+RISK_FACTOR_WEIGHTS = np.array([0.3, 0.25, 0.15, 0.2, 0.1])
+
+# Position scarcity risk; positions not listed fall back to DEFAULT_POSITION_SCARCITY
+POSITION_SCARCITY = MappingProxyType({
+    PlayerPosition.QB: 0.8,
+    PlayerPosition.RB: 0.7,
+    PlayerPosition.WR: 0.5,
+    PlayerPosition.TE: 0.6
+})
+DEFAULT_POSITION_SCARCITY = 0.5
+
+# Injuries within this many years count towards injury risk
+INJURY_LOOKBACK_YEARS = 2
+
+# Two-sided 95% standard normal quantile and relative std-dev of metric estimates
+Z_95 = 1.959963984540054
+METRIC_RELATIVE_STD = 0.1
+
+# Upper bound on memoized advanced-metric results per calculator
+STATS_CACHE_MAXSIZE = 10_000
+
+# Sentinel distinguishing a cache miss from a cached value
+_MISS = object()
+
 # Configure logging
 LOGGER = logging.getLogger(__name__)
 
@@ -40,15 +96,11 @@ def generate_cache_key(prefix: str, params: Dict[str, Any]) -> str:
         Unique cache key string
     """
     try:
-        # Sort parameters for consistency
-        sorted_params = dict(sorted(params.items()))
-        
-        # Convert parameters to string format
-        param_str = json.dumps(sorted_params, sort_keys=True)
-        
-        # Generate SHA-256 hash
-        hash_obj = hashlib.sha256(param_str.encode())
-        hash_str = hash_obj.hexdigest()
+        # Stream parameters into a 128-bit non-cryptographic hash in sorted key order
+        # (keys need uniqueness, not secrecy) without building an intermediate JSON string
+        hasher = xxhash.xxh3_128()
+        _update_hash(hasher, params)
+        hash_str = hasher.hexdigest()
         
         # Combine prefix with hash
         cache_key = f"{prefix}:{hash_str}"
@@ -60,13 +112,46 @@ def generate_cache_key(prefix: str, params: Dict[str, Any]) -> str:
         LOGGER.error(f"Error generating cache key: {str(e)}")
         raise
 
-def format_player_stats(raw_stats: Dict[str, Any], sport_type: SportType) -> Dict[str, Any]:
+def _update_hash(hasher: Any, value: Any) -> None:
+    """
+    Feeds a canonical byte representation of value into hasher.
+
+    Dicts are walked in sorted key order and sequences in order, so equal
+    parameters always hash equally; scalars contribute their repr.
+
+    Args:
+        hasher: Incremental hash object exposing update()
+        value: Value to hash
+    """
+    if isinstance(value, dict):
+        hasher.update(b'{')
+        for key in sorted(value):
+            hasher.update(repr(key).encode())
+            hasher.update(b'=')
+            _update_hash(hasher, value[key])
+            hasher.update(b'|')
+        hasher.update(b'}')
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b'[')
+        for item in value:
+            _update_hash(hasher, item)
+            hasher.update(b',')
+        hasher.update(b']')
+    else:
+        hasher.update(repr(value).encode())
+
+def format_player_stats(
+    raw_stats: Dict[str, Any],
+    sport_type: SportType,
+    timestamp: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Formats and validates raw player statistics into standardized format with derived metrics.
     
     Args:
         raw_stats: Dictionary containing raw player statistics
         sport_type: SportType enum indicating the sport
+        timestamp: Optional ISO timestamp to stamp on the result; defaults to current UTC time
     
     Returns:
         Dictionary containing formatted player statistics with derived metrics
@@ -82,7 +167,7 @@ def format_player_stats(raw_stats: Dict[str, Any], sport_type: SportType) -> Dic
             'player_id': raw_stats['player_id'],
             'name': raw_stats['name'],
             'position': POSITION_MAPPINGS[sport_type].get(raw_stats['position'], raw_stats['position']),
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': timestamp or datetime.utcnow().isoformat(),
             'metrics': {}
         }
 
@@ -101,6 +186,20 @@ def format_player_stats(raw_stats: Dict[str, Any], sport_type: SportType) -> Dic
         LOGGER.error(f"Error formatting player stats: {str(e)}")
         raise
 
+def format_player_stats_batch(rows: List[Dict[str, Any]], sport_type: SportType) -> List[Dict[str, Any]]:
+    """
+    Formats a batch of raw player statistics sharing a single timestamp.
+    
+    Args:
+        rows: List of raw player statistics dictionaries
+        sport_type: SportType enum indicating the sport
+    
+    Returns:
+        List of formatted player statistics in input order
+    """
+    timestamp = datetime.utcnow().isoformat()
+    return [format_player_stats(row, sport_type, timestamp) for row in rows]
+
 def calculate_trade_risk(players_offered: List[Dict], players_requested: List[Dict]) -> float:
     """
     Calculates comprehensive risk score for a proposed trade using multiple factors.
@@ -113,47 +212,26 @@ def calculate_trade_risk(players_offered: List[Dict], players_requested: List[Di
         Float between 0 and 1 representing trade risk
     """
     try:
-        risk_factors = {
-            'injury_history': 0.3,
-            'performance_volatility': 0.25,
-            'age_factor': 0.15,
-            'position_scarcity': 0.2,
-            'schedule_difficulty': 0.1
-        }
-        
-        total_risk = 0.0
-        
-        # Calculate risk for each factor
-        for players in [players_offered, players_requested]:
-            for player in players:
-                # Injury risk calculation
-                injury_risk = _calculate_injury_risk(player)
-                
-                # Performance volatility
-                volatility = _calculate_performance_volatility(player)
-                
-                # Age-based risk
-                age_risk = _calculate_age_risk(player)
-                
-                # Position scarcity
-                scarcity_risk = _calculate_position_scarcity(player)
-                
-                # Schedule difficulty
-                schedule_risk = _calculate_schedule_risk(player)
-                
-                # Weighted risk calculation
-                player_risk = (
-                    injury_risk * risk_factors['injury_history'] +
-                    volatility * risk_factors['performance_volatility'] +
-                    age_risk * risk_factors['age_factor'] +
-                    scarcity_risk * risk_factors['position_scarcity'] +
-                    schedule_risk * risk_factors['schedule_difficulty']
-                )
-                
-                total_risk += player_risk
+        players = players_offered + players_requested
+        if not players:
+            raise ValueError("Trade must include at least one player")
+
+        # Injuries after this year count as recent; resolved once per trade
+        injury_cutoff_year = datetime.now().year - INJURY_LOOKBACK_YEARS
+        factors = _players_to_arrays(players, injury_cutoff_year)
+
+        # Weighted risk summed over players in one compiled pass
+        total_risk = trade_risk_total(
+            factors['injury_risk'],
+            factors['volatility'],
+            factors['age'],
+            factors['scarcity'],
+            factors['schedule_difficulty'],
+            RISK_FACTOR_WEIGHTS
+        )
 
         # Normalize final risk score between 0 and 1
-        final_risk = min(1.0, total_risk / len(players_offered + players_requested))
+        final_risk = min(1.0, total_risk / len(players))
         
         LOGGER.debug(f"Calculated trade risk: {final_risk}")
         return final_risk
@@ -162,6 +240,26 @@ def calculate_trade_risk(players_offered: List[Dict], players_requested: List[Di
         LOGGER.error(f"Error calculating trade risk: {str(e)}")
         raise
 
+def _players_to_arrays(players: List[Dict], injury_cutoff_year: int) -> Dict[str, np.ndarray]:
+    """
+    Converts player dictionaries into per-factor arrays (struct-of-arrays).
+
+    Args:
+        players: List of player dictionaries
+        injury_cutoff_year: Injuries dated after this year count as recent
+
+    Returns:
+        Dictionary of float arrays, one entry per player in each
+    """
+    count = len(players)
+    return {
+        'injury_risk': np.fromiter((_calculate_injury_risk(p, injury_cutoff_year) for p in players), np.float64, count),
+        'volatility': np.fromiter((_calculate_performance_volatility(p) for p in players), np.float64, count),
+        'age': np.fromiter((p.get('age', 25) for p in players), np.float64, count),
+        'scarcity': np.fromiter((_calculate_position_scarcity(p) for p in players), np.float64, count),
+        'schedule_difficulty': np.fromiter((p.get('schedule_difficulty', 0.5) for p in players), np.float64, count)
+    }
+
 class StatisticsCalculator:
     """
     Advanced statistics calculator with sport-specific implementations and caching.
@@ -174,9 +272,9 @@ class StatisticsCalculator:
         Args:
             cache_ttl: Optional cache time-to-live in seconds
         """
-        self._calculators: Dict[SportType, Dict[str, Callable]] = {}
-        self._cache: Dict[str, Any] = {}
+        self._calculators: Dict[SportType, Tuple[Tuple[str, Callable], ...]] = {}
         self._cache_ttl = cache_ttl or CACHE_TTL_PLAYER_STATS
+        self._cache: TTLCache = TTLCache(maxsize=STATS_CACHE_MAXSIZE, ttl=self._cache_ttl)
         
         # Register sport-specific calculators
         self._register_calculators()
@@ -200,16 +298,18 @@ class StatisticsCalculator:
             })
             
             # Check cache
-            if cache_key in self._cache:
-                return self._cache[cache_key]
+            cached = self._cache.get(cache_key, _MISS)
+            if cached is not _MISS:
+                return cached
             
             # Get sport-specific calculators
-            sport_calculators = self._calculators.get(sport_type, {})
+            sport_calculators = self._calculators.get(sport_type, ())
             
             # Calculate metrics
-            advanced_metrics = {}
-            for metric_name, calculator in sport_calculators.items():
-                advanced_metrics[metric_name] = calculator(base_stats)
+            advanced_metrics = {
+                metric_name: calculator(base_stats)
+                for metric_name, calculator in sport_calculators
+            }
             
             # Calculate confidence intervals
             confidence_intervals = self._calculate_confidence_intervals(advanced_metrics)
@@ -228,100 +328,67 @@ class StatisticsCalculator:
     def _register_calculators(self):
         """Register sport-specific statistical calculators."""
         # NFL Calculators
-        self._calculators[SportType.NFL] = {
-            'qbr': self._calculate_qbr,
-            'yards_per_attempt': self._calculate_yards_per_attempt,
-            'touchdown_rate': self._calculate_touchdown_rate
-        }
+        self._calculators[SportType.NFL] = (
+            ('qbr', self._calculate_qbr),
+            ('yards_per_attempt', self._calculate_yards_per_attempt),
+            ('touchdown_rate', self._calculate_touchdown_rate)
+        )
         
         # NBA Calculators
-        self._calculators[SportType.NBA] = {
-            'per': self._calculate_per,
-            'true_shooting': self._calculate_true_shooting,
-            'usage_rate': self._calculate_usage_rate
-        }
+        self._calculators[SportType.NBA] = (
+            ('per', self._calculate_per),
+            ('true_shooting', self._calculate_true_shooting),
+            ('usage_rate', self._calculate_usage_rate)
+        )
         
         # MLB Calculators
-        self._calculators[SportType.MLB] = {
-            'ops': self._calculate_ops,
-            'whip': self._calculate_whip,
-            'war': self._calculate_war
-        }
+        self._calculators[SportType.MLB] = (
+            ('ops', self._calculate_ops),
+            ('whip', self._calculate_whip),
+            ('war', self._calculate_war)
+        )
 
     def _calculate_confidence_intervals(self, metrics: Dict[str, float]) -> Dict[str, Dict[str, float]]:
-        """Calculate confidence intervals for metrics using bootstrapping."""
-        confidence_intervals = {}
-        for metric, value in metrics.items():
-            if isinstance(value, (int, float)):
-                # Generate bootstrap samples
-                samples = np.random.normal(value, value * 0.1, 1000)
-                confidence_intervals[metric] = {
-                    'lower': np.percentile(samples, 2.5),
-                    'upper': np.percentile(samples, 97.5)
-                }
-        return confidence_intervals
+        """
+        Calculate 95% confidence intervals for metrics modelled as N(value, 0.1 * value).
+
+        Uses the closed-form normal quantiles, which the former bootstrap
+        (1000 samples per metric) only approximated.
+        """
+        names = [metric for metric, value in metrics.items() if isinstance(value, (int, float))]
+        values = np.fromiter((metrics[name] for name in names), np.float64, len(names))
+        half_widths = Z_95 * METRIC_RELATIVE_STD * np.abs(values)
+        return {
+            name: {'lower': lower, 'upper': upper}
+            for name, lower, upper in zip(
+                names, (values - half_widths).tolist(), (values + half_widths).tolist()
+            )
+        }
 
 # Helper functions for format_player_stats
 def _format_nfl_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
     """Format NFL-specific statistics."""
-    return {
-        'passing_yards': stats.get('passing_yards', 0),
-        'rushing_yards': stats.get('rushing_yards', 0),
-        'touchdowns': stats.get('touchdowns', 0),
-        'interceptions': stats.get('interceptions', 0),
-        'completion_percentage': stats.get('completion_percentage', 0.0)
-    }
+    return {field: stats.get(field, default) for field, default in NFL_STAT_FIELDS}
 
 def _format_nba_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
     """Format NBA-specific statistics."""
-    return {
-        'points': stats.get('points', 0),
-        'rebounds': stats.get('rebounds', 0),
-        'assists': stats.get('assists', 0),
-        'steals': stats.get('steals', 0),
-        'blocks': stats.get('blocks', 0)
-    }
+    return {field: stats.get(field, default) for field, default in NBA_STAT_FIELDS}
 
 def _format_mlb_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
     """Format MLB-specific statistics."""
-    return {
-        'batting_average': stats.get('batting_average', 0.0),
-        'home_runs': stats.get('home_runs', 0),
-        'rbis': stats.get('rbis', 0),
-        'stolen_bases': stats.get('stolen_bases', 0),
-        'era': stats.get('era', 0.0)
-    }
+    return {field: stats.get(field, default) for field, default in MLB_STAT_FIELDS}
 
 # Helper functions for calculate_trade_risk
-def _calculate_injury_risk(player: Dict) -> float:
-    """Calculate injury risk based on player history."""
-    injury_history = player.get('injury_history', [])
-    recent_injuries = [i for i in injury_history if i['date'] > datetime.now().year - 2]
-    return min(1.0, len(recent_injuries) * 0.2)
+def _calculate_injury_risk(player: Dict, cutoff_year: int) -> float:
+    """Calculate unclamped injury risk based on injuries dated after cutoff_year."""
+    recent_injuries = sum(1 for i in player.get('injury_history', ()) if i['date'] > cutoff_year)
+    return recent_injuries * 0.2
 
 def _calculate_performance_volatility(player: Dict) -> float:
     """Calculate performance volatility using standard deviation."""
-    performances = player.get('recent_performances', [])
-    if not performances:
-        return 0.5
-    return min(1.0, np.std(performances) / 100)
-
-def _calculate_age_risk(player: Dict) -> float:
-    """Calculate age-based risk factor."""
-    age = player.get('age', 25)
-    return min(1.0, max(0.0, (age - 26) * 0.1))
+    performances = np.asarray(player.get('recent_performances', ()), dtype=np.float64)
+    return std_bounded(performances, 100.0)
 
 def _calculate_position_scarcity(player: Dict) -> float:
     """Calculate risk based on position scarcity."""
-    position_scarcity_map = {
-        PlayerPosition.QB: 0.8,
-        PlayerPosition.RB: 0.7,
-        PlayerPosition.WR: 0.5,
-        PlayerPosition.TE: 0.6
-    }
-    return position_scarcity_map.get(player.get('position'), 0.5)
-
-def _calculate_schedule_risk(player: Dict) -> float:
-    """Calculate risk based on upcoming schedule difficulty."""
-    schedule_difficulty = player.get('schedule_difficulty', 0.5)
-    return min(1.0, schedule_difficulty)
\ No newline at end of file
+    return POSITION_SCARCITY.get(player.get('position'), DEFAULT_POSITION_SCARCITY)
\ No newline at end of file
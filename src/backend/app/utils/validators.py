@@ -6,7 +6,9 @@ and Pydantic models for data validation across the Fantasy GM Assistant backend.
 # Python 3.11+
 import re
 import logging
-from typing import Dict, List, Set, Tuple, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import FrozenSet, List, Mapping, Tuple, Optional
 from dataclasses import dataclass
 from datetime import datetime
 from cachetools import TTLCache, cached  # v5.0+
@@ -23,6 +25,10 @@ EMAIL_REGEX = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
 USERNAME_REGEX = r'^[a-zA-Z0-9_-]{3,20}$'
 PASSWORD_REGEX = r'^(?=.*[A-Za-z])(?=.*\d)(?=.*[@$!%*#?&])[A-Za-z\d@$!%*#?&]{8,}$'
 
+# Patterns compiled once at import time
+_EMAIL_RE = re.compile(EMAIL_REGEX)
+_USERNAME_RE = re.compile(USERNAME_REGEX)
+
 # Cache configuration
 VALIDATION_CACHE_TTL = 300  # 5 minutes
 
@@ -42,7 +48,7 @@ def validate_email(email: str) -> Tuple[bool, str]:
         if not email:
             return False, "Email cannot be empty"
             
-        if not re.match(EMAIL_REGEX, email):
+        if not _EMAIL_RE.match(email):
             return False, "Invalid email format"
             
         return True, ""
@@ -66,7 +72,7 @@ def validate_username(username: str) -> Tuple[bool, str]:
         if not username:
             return False, "Username cannot be empty"
             
-        if not re.match(USERNAME_REGEX, username):
+        if not _USERNAME_RE.match(username):
             return False, "Username must be 3-20 characters and contain only letters, numbers, underscores, and hyphens"
             
         return True, ""
@@ -106,35 +112,58 @@ def validate_trade_players(player_ids: List[str], sport_type: SportType) -> Tupl
         logger.error(f"Trade players validation error: {str(e)}")
         return False, "Trade players validation failed"
 
+# Valid positions per sport
+_VALID_POSITIONS: Mapping[SportType, FrozenSet[PlayerPosition]] = MappingProxyType({
+    SportType.NFL: frozenset({
+        PlayerPosition.QB, PlayerPosition.RB, PlayerPosition.WR,
+        PlayerPosition.TE, PlayerPosition.K, PlayerPosition.DEF
+    }),
+    SportType.NBA: frozenset({
+        PlayerPosition.PG, PlayerPosition.SG, PlayerPosition.SF,
+        PlayerPosition.PF, PlayerPosition.C
+    }),
+    SportType.MLB: frozenset({
+        PlayerPosition.P, PlayerPosition.C1B, PlayerPosition.C2B,
+        PlayerPosition.C3B, PlayerPosition.SS, PlayerPosition.OF,
+        PlayerPosition.DH
+    })
+})
+
+# Sport/position inputs form a small closed set, so results are memoized without expiry
+@lru_cache(maxsize=64)
+def _validate_sport_cached(sport_type: SportType) -> Tuple[bool, str]:
+    """Validates sport type; results are memoized per sport."""
+    if sport_type not in SportType:
+        return False, f"Unsupported sport type: {sport_type}"
+    return True, ""
+
+@lru_cache(maxsize=64)
+def _validate_position_cached(sport_type: SportType, position: PlayerPosition) -> Tuple[bool, str]:
+    """Validates position for sport; results are memoized per sport/position pair."""
+    sport_valid, sport_error = _validate_sport_cached(sport_type)
+    if not sport_valid:
+        return False, sport_error
+    if position not in _VALID_POSITIONS[sport_type]:
+        return False, f"Invalid position {position} for sport {sport_type}"
+    return True, ""
+
 @dataclass
 class SportValidator:
     """
     Enhanced validator class for sport-related data validation with caching.
     """
+
+    _valid_positions = _VALID_POSITIONS
     
     def __init__(self, cache_ttl: int = VALIDATION_CACHE_TTL):
         """
-        Initialize sport validator with caching support.
+        Initialize sport validator.
         
         Args:
-            cache_ttl (int): Cache TTL in seconds
+            cache_ttl (int): Retained for backward compatibility; results over the
+                closed sport/position set are memoized without expiry
         """
-        self._valid_positions: Dict[SportType, Set[PlayerPosition]] = {
-            SportType.NFL: {
-                PlayerPosition.QB, PlayerPosition.RB, PlayerPosition.WR,
-                PlayerPosition.TE, PlayerPosition.K, PlayerPosition.DEF
-            },
-            SportType.NBA: {
-                PlayerPosition.PG, PlayerPosition.SG, PlayerPosition.SF,
-                PlayerPosition.PF, PlayerPosition.C
-            },
-            SportType.MLB: {
-                PlayerPosition.P, PlayerPosition.C1B, PlayerPosition.C2B,
-                PlayerPosition.C3B, PlayerPosition.SS, PlayerPosition.OF,
-                PlayerPosition.DH
-            }
-        }
-        self._validation_cache = TTLCache(maxsize=1000, ttl=cache_ttl)
+        self._cache_ttl = cache_ttl
 
     def validate_sport(self, sport_type: SportType) -> Tuple[bool, str]:
         """
@@ -146,18 +175,8 @@ class SportValidator:
         Returns:
             Tuple[bool, str]: (is_valid, error_message)
         """
-        cache_key = f"sport_{sport_type}"
-        if cache_key in self._validation_cache:
-            return self._validation_cache[cache_key]
-            
         try:
-            if sport_type not in SportType:
-                result = (False, f"Unsupported sport type: {sport_type}")
-            else:
-                result = (True, "")
-                
-            self._validation_cache[cache_key] = result
-            return result
+            return _validate_sport_cached(sport_type)
         except Exception as e:
             logger.error(f"Sport validation error: {str(e)}")
             return False, "Sport validation failed"
@@ -173,24 +192,8 @@ class SportValidator:
         Returns:
             Tuple[bool, str]: (is_valid, error_message)
         """
-        cache_key = f"position_{sport_type}_{position}"
-        if cache_key in self._validation_cache:
-            return self._validation_cache[cache_key]
-            
         try:
-            # Validate sport type first
-            sport_valid, sport_error = self.validate_sport(sport_type)
-            if not sport_valid:
-                return False, sport_error
-                
-            # Validate position for sport
-            if position not in self._valid_positions[sport_type]:
-                result = (False, f"Invalid position {position} for sport {sport_type}")
-            else:
-                result = (True, "")
-                
-            self._validation_cache[cache_key] = result
-            return result
+            return _validate_position_cached(sport_type, position)
         except Exception as e:
             logger.error(f"Position validation error: {str(e)}")
             return False, "Position validation failed"
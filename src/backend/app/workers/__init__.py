@@ -5,20 +5,29 @@ with enhanced performance monitoring and task routing.
 Version: Python 3.11+
 """
 
+from collections import deque
 from datetime import datetime
+import threading
+import time
 from typing import Any, Dict, Optional
 import structlog
 
+from app.core.exceptions import IntegrationError
 from app.workers.celery_app import celery_app, Task
 from app.workers.simulation_tasks import (
     simulate_lineup_task,
     analyze_trade_task,
-    simulate_season_task
+    simulate_season_task,
+    run_analysis_bundle,
+    enqueue_lineups,
+    enqueue_lineup_chunks
 )
 from app.workers.media_tasks import (
     generate_voice_content,
     generate_video_content,
-    check_video_status
+    check_video_status,
+    generate_voice_batch,
+    generate_video_batch
 )
 from app.workers.analytics_tasks import (
     process_user_analytics,
@@ -54,6 +63,17 @@ TASK_ROUTES = {
     'app.workers.analytics_tasks.*': {'queue': 'analytics'}
 }
 
+# Number of most recent task durations retained per task class
+PROCESSING_TIMES_WINDOW = 1024
+
+# Successful tasks are logged when slower than this many seconds, otherwise
+# one in every SUCCESS_LOG_SAMPLE_RATE completions is logged
+SLOW_TASK_THRESHOLD_SECONDS = 5.0
+SUCCESS_LOG_SAMPLE_RATE = 256
+
+# Failures retried by on_failure; anything else (e.g. bad input) fails immediately
+RETRYABLE_EXCEPTIONS = (IntegrationError,)
+
 class MonitoredTask(Task):
     """Enhanced base task class with performance monitoring and error handling."""
 
@@ -63,10 +83,23 @@ class MonitoredTask(Task):
         self.metrics = {
             'success_count': 0,
             'failure_count': 0,
-            'processing_times': [],
+            'processing_times': deque(maxlen=PROCESSING_TIMES_WINDOW),
             'last_error': None,
             'last_success': None
         }
+        # Guards metrics updates from concurrently running handlers
+        self._metrics_lock = threading.Lock()
+
+    def before_start(self, task_id: str, args: Dict, kwargs: Dict) -> None:
+        """
+        Record the start time on the request so completion handlers can time the task.
+
+        Args:
+            task_id: Unique task identifier
+            args: Task positional arguments
+            kwargs: Task keyword arguments
+        """
+        self.request.started_at = time.perf_counter()
 
     def on_success(self, retval: Any, task_id: str, args: Dict, kwargs: Dict) -> None:
         """
@@ -80,17 +113,26 @@ class MonitoredTask(Task):
         """
         try:
             # Update success metrics
-            self.metrics['success_count'] += 1
-            self.metrics['last_success'] = datetime.utcnow().isoformat()
-
-            # Log success with context
-            logger.info(
-                "Task completed successfully",
-                task_id=task_id,
-                task_name=self.name,
-                execution_time=self.request.duration,
-                correlation_id=kwargs.get('correlation_id')
-            )
+            started_at = getattr(self.request, 'started_at', None)
+            execution_time = time.perf_counter() - started_at if started_at is not None else None
+            completed_at = datetime.utcnow().isoformat()
+            with self._metrics_lock:
+                self.metrics['success_count'] += 1
+                success_count = self.metrics['success_count']
+                self.metrics['last_success'] = completed_at
+                if execution_time is not None:
+                    self.metrics['processing_times'].append(execution_time)
+
+            # Log success with context for slow tasks and a sample of the rest
+            is_slow = execution_time is not None and execution_time > SLOW_TASK_THRESHOLD_SECONDS
+            if is_slow or success_count % SUCCESS_LOG_SAMPLE_RATE == 0:
+                logger.info(
+                    "Task completed successfully",
+                    task_id=task_id,
+                    task_name=self.name,
+                    execution_time=execution_time,
+                    correlation_id=kwargs.get('correlation_id')
+                )
 
         except Exception as e:
             logger.error(
@@ -112,12 +154,14 @@ class MonitoredTask(Task):
         """
         try:
             # Update failure metrics
-            self.metrics['failure_count'] += 1
-            self.metrics['last_error'] = {
+            last_error = {
                 'timestamp': datetime.utcnow().isoformat(),
                 'error': str(exc),
                 'task_id': task_id
             }
+            with self._metrics_lock:
+                self.metrics['failure_count'] += 1
+                self.metrics['last_error'] = last_error
 
             # Log failure with context
             logger.error(
@@ -129,10 +173,6 @@ class MonitoredTask(Task):
                 exc_info=True
             )
 
-            # Trigger retry if applicable
-            if not self.request.retries >= self.max_retries:
-                self.retry(exc=exc, countdown=self.default_retry_delay)
-
         except Exception as e:
             logger.error(
                 "Error recording task failure metrics",
@@ -140,6 +180,18 @@ class MonitoredTask(Task):
                 error=str(e)
             )
 
+        # Retry transient failures up to max_retries; None means no automatic retry.
+        # Tasks using autoretry_for already retried before reaching this handler.
+        # throw=False re-enqueues without raising Retry out of the failure handler
+        max_retries = self.max_retries
+        if (
+            max_retries is not None
+            and not getattr(self, 'autoretry_for', None)
+            and isinstance(exc, RETRYABLE_EXCEPTIONS)
+            and self.request.retries < max_retries
+        ):
+            self.retry(exc=exc, countdown=self.default_retry_delay, throw=False)
+
 # Configure Celery application with monitoring
 celery_app.Task = MonitoredTask
 
@@ -151,10 +203,15 @@ __all__ = [
     'simulate_lineup_task',
     'analyze_trade_task',
     'simulate_season_task',
+    'run_analysis_bundle',
+    'enqueue_lineups',
+    'enqueue_lineup_chunks',
     # Media tasks
     'generate_voice_content',
     'generate_video_content',
     'check_video_status',
+    'generate_voice_batch',
+    'generate_video_batch',
     # Analytics tasks
     'process_user_analytics',
     'update_performance_metrics',
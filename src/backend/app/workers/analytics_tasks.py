@@ -3,14 +3,21 @@ from datetime import datetime, timedelta
 import json
 import numpy as np  # v1.24+
 import psutil  # v5.9+
-from typing import Dict, List, Optional
+from cachetools import TTLCache  # cachetools v5.3+
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from app.workers.celery_app import celery_app
+from app.workers.celery_app import celery_app, METRICS_INTERVAL
 from app.models.analytics import UserAnalytics, PerformanceMetrics
-from app.services.redis_service import RedisService, CACHE_TTL
+from app.services.redis_service import (
+    RedisService,
+    CACHE_TTL,
+    LATENCY_BUCKET_GROWTH,
+    API_LATENCY_HISTOGRAM_KEY
+)
 from app.core.exceptions import IntegrationError
 from app.core.logging import get_logger
+from app.utils._numeric_kernels import mean_and_percentiles
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -18,9 +25,19 @@ logger = get_logger(__name__)
 # Initialize Redis service
 redis_service = RedisService()
 
+# Prime psutil's CPU sampler so later non-blocking reads report usage since the previous call
+psutil.cpu_percent(interval=None)
+
 # Constants for analytics processing
 ANALYTICS_BATCH_SIZE = 100
-METRICS_INTERVAL = 300  # 5 minutes
+
+# Percentiles reported for AI processing times
+AI_PROCESSING_PERCENTILES = np.array([95.0, 99.0])
+
+# In-process cache in front of Redis; TTL kept well below the Redis TTLs
+LOCAL_CACHE_MAXSIZE = 512
+LOCAL_CACHE_TTL_SECONDS = 60
+_local_cache: TTLCache = TTLCache(maxsize=LOCAL_CACHE_MAXSIZE, ttl=LOCAL_CACHE_TTL_SECONDS)
 
 # Cache key templates
 CACHE_KEYS = {
@@ -37,7 +54,37 @@ ERROR_THRESHOLDS = {
     'MAX_DELAY': 300
 }
 
-@celery_app.task(queue='analytics', retry_backoff=True)
+def _histogram_summary(histogram: Dict[int, int], percentiles: Tuple[float, ...]) -> Tuple[float, Tuple[float, ...]]:
+    """
+    Approximate mean and percentiles of a latency histogram.
+
+    Each bucket is represented by its upper bound, so estimates are within the
+    bucket growth factor of the true value.
+
+    Args:
+        histogram: Mapping of bucket index to sample count
+        percentiles: Percentiles to estimate, in the range [0, 100]
+
+    Returns:
+        Tuple of (mean, percentile estimates in the order requested)
+    """
+    buckets = np.fromiter(sorted(histogram), dtype=np.int64, count=len(histogram))
+    counts = np.fromiter((histogram[b] for b in buckets.tolist()), dtype=np.float64, count=len(histogram))
+    bounds = np.power(LATENCY_BUCKET_GROWTH, buckets.astype(np.float64))
+    cumulative = np.cumsum(counts)
+    total = cumulative[-1]
+    ranks = np.asarray(percentiles, dtype=np.float64) / 100.0 * total
+    indices = np.minimum(np.searchsorted(cumulative, ranks, side='left'), len(bounds) - 1)
+    return float(counts @ bounds / total), tuple(bounds[indices].tolist())
+
+@celery_app.task(
+    queue='analytics',
+    autoretry_for=(IntegrationError,),
+    retry_backoff=ERROR_THRESHOLDS['BACKOFF_FACTOR'],
+    retry_backoff_max=ERROR_THRESHOLDS['MAX_DELAY'],
+    retry_jitter=True,
+    max_retries=ERROR_THRESHOLDS['MAX_RETRIES']
+)
 async def process_user_analytics(
     user_id: UUID,
     session_data: Dict,
@@ -59,8 +106,12 @@ async def process_user_analytics(
         
         # Check cache unless force refresh
         if not force_refresh:
+            cached_data = _local_cache.get(cache_key)
+            if cached_data is not None:
+                return cached_data
             cached_data = await redis_service.get(cache_key)
             if cached_data:
+                _local_cache[cache_key] = cached_data
                 return cached_data
 
         # Get or create analytics record
@@ -92,6 +143,7 @@ async def process_user_analytics(
             value=engagement_metrics,
             ttl=CACHE_TTL['USER_ANALYTICS']
         )
+        _local_cache[cache_key] = engagement_metrics
         
         return engagement_metrics
 
@@ -100,7 +152,6 @@ async def process_user_analytics(
         raise IntegrationError(f"Analytics processing failed: {str(e)}")
 
 @celery_app.task(queue='analytics')
-@celery_app.periodic_task(run_every=METRICS_INTERVAL)
 async def update_performance_metrics() -> Dict:
     """
     Collect and store comprehensive system performance metrics.
@@ -111,29 +162,33 @@ async def update_performance_metrics() -> Dict:
     try:
         metrics = PerformanceMetrics()
         
-        # Collect system metrics
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # Collect system metrics; CPU usage covers the time since the previous run
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage('/')
         
         # Update metrics
         metrics.cpu_usage = cpu_percent
         metrics.memory_usage = memory.percent
-        metrics.api_requests = await redis_service.get('api_request_count') or 0
         
-        # Calculate response times
-        api_latencies = await redis_service.get('api_latencies') or []
-        if api_latencies:
-            metrics.api_response_time = np.mean(api_latencies)
+        # Take this interval's API latency histogram and reset it in a single round-trip
+        latency_histogram = await redis_service.pop_histogram(API_LATENCY_HISTOGRAM_KEY)
+        metrics.api_requests = sum(latency_histogram.values())
+        
+        # Calculate response times from the histogram
+        if latency_histogram:
+            metrics.api_response_time, (p50, p95, p99) = _histogram_summary(
+                latency_histogram, (50, 95, 99)
+            )
             metrics.endpoint_latencies = {
-                'p50': np.percentile(api_latencies, 50),
-                'p95': np.percentile(api_latencies, 95),
-                'p99': np.percentile(api_latencies, 99)
+                'p50': p50,
+                'p95': p95,
+                'p99': p99
             }
         
         # Store metrics
         metrics_data = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': datetime.utcnow(),
             'cpu_usage': metrics.cpu_usage,
             'memory_usage': metrics.memory_usage,
             'disk_usage': disk.percent,
@@ -156,7 +211,14 @@ async def update_performance_metrics() -> Dict:
         logger.error(f"Error updating performance metrics: {str(e)}")
         raise IntegrationError(f"Performance metrics update failed: {str(e)}")
 
-@celery_app.task(queue='analytics', retry_backoff=True)
+@celery_app.task(
+    queue='analytics',
+    autoretry_for=(IntegrationError,),
+    retry_backoff=ERROR_THRESHOLDS['BACKOFF_FACTOR'],
+    retry_backoff_max=ERROR_THRESHOLDS['MAX_DELAY'],
+    retry_jitter=True,
+    max_retries=ERROR_THRESHOLDS['MAX_RETRIES']
+)
 async def aggregate_sport_analytics(
     sport_type: str,
     analysis_params: Dict
@@ -185,17 +247,17 @@ async def aggregate_sport_analytics(
         
         # Aggregate results
         analytics_data = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': datetime.utcnow(),
             'sport_type': sport_type,
             'team_statistics': team_stats,
             'league_trends': league_trends,
             'position_distribution': position_stats
         }
         
-        # Cache results
-        await redis_service.set(
+        # Cache results as a hash so consumers can read single sections
+        await redis_service.set_hash(
             key=cache_key,
-            value=analytics_data,
+            mapping=analytics_data,
             ttl=CACHE_TTL['SPORT_ANALYTICS']
         )
         
@@ -205,7 +267,14 @@ async def aggregate_sport_analytics(
         logger.error(f"Error aggregating sport analytics: {str(e)}")
         raise IntegrationError(f"Sport analytics aggregation failed: {str(e)}")
 
-@celery_app.task(queue='analytics', retry_backoff=True)
+@celery_app.task(
+    queue='analytics',
+    autoretry_for=(IntegrationError,),
+    retry_backoff=ERROR_THRESHOLDS['BACKOFF_FACTOR'],
+    retry_backoff_max=ERROR_THRESHOLDS['MAX_DELAY'],
+    retry_jitter=True,
+    max_retries=ERROR_THRESHOLDS['MAX_RETRIES']
+)
 async def track_ai_metrics(
     prediction_data: Dict,
     model_type: str
@@ -227,11 +296,12 @@ async def track_ai_metrics(
         accuracy_metrics = calculate_prediction_accuracy(prediction_data)
         
         # Track processing times
-        processing_times = prediction_data.get('processing_times', [])
+        processing_times = np.asarray(prediction_data.get('processing_times', []), dtype=np.float64)
+        mean_time, (p95, p99) = mean_and_percentiles(processing_times, AI_PROCESSING_PERCENTILES)
         performance_metrics = {
-            'mean_processing_time': np.mean(processing_times),
-            'p95_processing_time': np.percentile(processing_times, 95),
-            'p99_processing_time': np.percentile(processing_times, 99)
+            'mean_processing_time': mean_time,
+            'p95_processing_time': float(p95),
+            'p99_processing_time': float(p99)
         }
         
         # Analyze error patterns
@@ -239,7 +309,7 @@ async def track_ai_metrics(
         
         # Aggregate metrics
         ai_metrics = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': datetime.utcnow(),
             'model_type': model_type,
             'accuracy_metrics': accuracy_metrics,
             'performance_metrics': performance_metrics,
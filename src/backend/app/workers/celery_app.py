@@ -2,6 +2,8 @@
 from celery import Celery  # celery v5.3+
 from kombu.utils.url import maybe_sanitize_url  # kombu v5.3+
 from kombu.connection import RetryingConnection  # kombu v5.3+
+from kombu import serialization  # kombu v5.3+
+import orjson  # orjson v3.9+
 from app.core.config import REDIS_URL, PROJECT_NAME, settings
 
 # Define task queues with priorities and rate limits
@@ -29,6 +31,28 @@ CELERY_TASK_QUEUES = {
     }
 }
 
+# Interval for periodic performance metrics collection
+METRICS_INTERVAL = 300  # 5 minutes
+
+# Periodic task schedule for celery beat
+CELERY_BEAT_SCHEDULE = {
+    'perf-metrics': {
+        'task': 'app.workers.analytics_tasks.update_performance_metrics',
+        'schedule': METRICS_INTERVAL
+    }
+}
+
+# orjson serializer; encodes datetimes, UUIDs, numpy values and non-str dict keys natively
+ORJSON_CONTENT_TYPE = 'application/x-orjson'
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+serialization.register(
+    'orjson',
+    lambda obj: orjson.dumps(obj, option=ORJSON_OPTIONS),
+    orjson.loads,
+    content_type=ORJSON_CONTENT_TYPE,
+    content_encoding='binary'
+)
+
 # Task routing configuration
 CELERY_TASK_ROUTES = {
     'app.workers.simulation_tasks.*': {'queue': 'simulation'},
@@ -72,11 +96,14 @@ def create_celery() -> Celery:
     app.conf.task_queues = CELERY_TASK_QUEUES
     app.conf.task_routes = CELERY_TASK_ROUTES
     app.conf.task_default_queue = 'analytics'  # Default queue for unspecified tasks
+
+    # Periodic tasks
+    app.conf.beat_schedule = CELERY_BEAT_SCHEDULE
     
     # Task execution settings
-    app.conf.task_serializer = 'json'
-    app.conf.result_serializer = 'json'
-    app.conf.accept_content = ['json']
+    app.conf.task_serializer = 'orjson'
+    app.conf.result_serializer = 'orjson'
+    app.conf.accept_content = ['orjson']
     app.conf.task_compression = 'gzip'
     app.conf.result_compression = 'gzip'
     
@@ -88,6 +115,7 @@ def create_celery() -> Celery:
     app.conf.worker_prefetch_multiplier = 1  # Prevent worker starvation
     app.conf.worker_max_tasks_per_child = 1000  # Prevent memory leaks
     app.conf.worker_max_memory_per_child = 150000  # 150MB memory limit
+    app.conf.worker_disable_rate_limits = True  # No task defines a rate limit; skip token-bucket bookkeeping
     
     # Task retry settings
     app.conf.task_acks_late = True  # Only acknowledge after task completion
@@ -1,9 +1,10 @@
 # Python 3.11+
+import asyncio
 import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 
-from tenacity import retry, stop_after_attempt, wait_exponential  # version 8.2.0
 import structlog  # version 23.1.0
 from prometheus_client import Counter, Histogram  # version 0.17.0
 
@@ -24,6 +25,7 @@ logger = structlog.get_logger(__name__)
 # Constants for task configuration
 MAX_RETRIES = 3
 RETRY_DELAY = 5
+MAX_RETRY_DELAY = 300  # Cap on exponential retry backoff in seconds
 TASK_QUEUE = 'media'
 MEDIA_GENERATION_TIMEOUT = 300  # 5 minutes
 MAX_CONTENT_SIZE = 100 * 1024 * 1024  # 100MB
@@ -51,16 +53,32 @@ VIDEO_GENERATION_DURATION = Histogram(
     buckets=[30, 60, 120, 300, 600]
 )
 
+# Pre-bound labelled counters for the completion hot path
+_VOICE_SUCCESS = VOICE_GENERATION_REQUESTS.labels(status='success')
+_VOICE_ERROR = VOICE_GENERATION_REQUESTS.labels(status='error')
+_VIDEO_SUCCESS = VIDEO_GENERATION_REQUESTS.labels(status='success')
+_VIDEO_ERROR = VIDEO_GENERATION_REQUESTS.labels(status='error')
+
+def _retry_countdown(retries: int) -> int:
+    """Exponential retry delay in seconds for the given attempt, capped at MAX_RETRY_DELAY."""
+    return min(RETRY_DELAY * (2 ** retries), MAX_RETRY_DELAY)
+
+@lru_cache(maxsize=1)
+def _get_eleven_labs_service() -> ElevenLabsService:
+    """Return the worker-process Eleven Labs service, created on first use."""
+    return ElevenLabsService()
+
+@lru_cache(maxsize=1)
+def _get_runway_service() -> RunwayMLService:
+    """Return the worker-process RunwayML service, created on first use."""
+    return RunwayMLService()
+
 @celery_app.task(
     queue=TASK_QUEUE,
     bind=True,
     max_retries=MAX_RETRIES,
     default_retry_delay=RETRY_DELAY
 )
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=4, max=10)
-)
 async def generate_voice_content(
     self,
     request: VoiceGenerationRequest,
@@ -87,21 +105,21 @@ async def generate_voice_content(
 
     try:
         with VOICE_GENERATION_DURATION.time():
-            # Initialize Eleven Labs service
-            eleven_labs = ElevenLabsService()
+            # Reuse the worker's Eleven Labs service
+            eleven_labs = _get_eleven_labs_service()
 
             # Generate voice content
             response = await eleven_labs.generate_voice(request)
 
             if response.status == 'completed':
-                VOICE_GENERATION_REQUESTS.labels(status='success').inc()
+                _VOICE_SUCCESS.inc()
                 logger.info(
                     "Voice generation completed successfully",
                     correlation_id=correlation_id,
                     duration_seconds=response.duration_seconds
                 )
             else:
-                VOICE_GENERATION_REQUESTS.labels(status='error').inc()
+                _VOICE_ERROR.inc()
                 logger.error(
                     "Voice generation failed",
                     correlation_id=correlation_id,
@@ -111,18 +129,23 @@ async def generate_voice_content(
             return response
 
     except Exception as e:
-        VOICE_GENERATION_REQUESTS.labels(status='error').inc()
+        _VOICE_ERROR.inc()
         logger.error(
             "Voice generation task failed",
             correlation_id=correlation_id,
             error=str(e),
             exc_info=True
         )
-        raise IntegrationError(
-            message="Voice generation failed",
-            error_code=6020,
-            details={'error': str(e)},
-            correlation_id=correlation_id
+        # Retry through the broker so the worker slot is freed during backoff;
+        # once retries are exhausted the IntegrationError itself is raised
+        raise self.retry(
+            exc=IntegrationError(
+                message="Voice generation failed",
+                error_code=6020,
+                details={'error': str(e)},
+                correlation_id=correlation_id
+            ),
+            countdown=_retry_countdown(self.request.retries)
         )
 
 @celery_app.task(
@@ -131,10 +154,6 @@ async def generate_voice_content(
     max_retries=MAX_RETRIES,
     default_retry_delay=RETRY_DELAY
 )
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=4, max=10)
-)
 async def generate_video_content(
     self,
     request: VideoGenerationRequest,
@@ -162,14 +181,14 @@ async def generate_video_content(
 
     try:
         with VIDEO_GENERATION_DURATION.time():
-            # Initialize RunwayML service
-            runway = RunwayMLService()
+            # Reuse the worker's RunwayML service
+            runway = _get_runway_service()
 
             # Generate video with progress tracking
             response = await runway.generate_video(request)
 
             if response.status == 'completed':
-                VIDEO_GENERATION_REQUESTS.labels(status='success').inc()
+                _VIDEO_SUCCESS.inc()
                 logger.info(
                     "Video generation completed successfully",
                     correlation_id=correlation_id,
@@ -177,7 +196,7 @@ async def generate_video_content(
                     trade_id=request.trade_id
                 )
             else:
-                VIDEO_GENERATION_REQUESTS.labels(status='error').inc()
+                _VIDEO_ERROR.inc()
                 logger.error(
                     "Video generation failed",
                     correlation_id=correlation_id,
@@ -188,7 +207,7 @@ async def generate_video_content(
             return response
 
     except Exception as e:
-        VIDEO_GENERATION_REQUESTS.labels(status='error').inc()
+        _VIDEO_ERROR.inc()
         logger.error(
             "Video generation task failed",
             correlation_id=correlation_id,
@@ -196,12 +215,127 @@ async def generate_video_content(
             trade_id=request.trade_id,
             exc_info=True
         )
-        raise IntegrationError(
-            message="Video generation failed",
-            error_code=6021,
-            details={
-                'error': str(e),
-                'trade_id': str(request.trade_id)
-            },
-            correlation_id=correlation_id
-        )
\ No newline at end of file
+        # Retry through the broker so the worker slot is freed during backoff;
+        # once retries are exhausted the IntegrationError itself is raised
+        raise self.retry(
+            exc=IntegrationError(
+                message="Video generation failed",
+                error_code=6021,
+                details={
+                    'error': str(e),
+                    'trade_id': str(request.trade_id)
+                },
+                correlation_id=correlation_id
+            ),
+            countdown=_retry_countdown(self.request.retries)
+        )
+
+@celery_app.task(
+    queue=TASK_QUEUE,
+    bind=True
+)
+async def generate_voice_batch(
+    self,
+    requests: List[VoiceGenerationRequest],
+    correlation_id: str
+) -> List[Optional[VoiceGenerationResponse]]:
+    """
+    Celery task generating several voice clips concurrently over one Eleven Labs client.
+
+    Failed items are logged and counted individually and do not fail the batch.
+
+    Args:
+        requests: Voice generation request parameters, e.g. one per script paragraph
+        correlation_id: Unique identifier for request tracking
+
+    Returns:
+        Responses in request order, None where generation raised
+    """
+    logger.info(
+        "Starting voice generation batch",
+        correlation_id=correlation_id,
+        task_id=self.request.id,
+        batch_size=len(requests)
+    )
+
+    eleven_labs = _get_eleven_labs_service()
+    results = await asyncio.gather(
+        *(eleven_labs.generate_voice(request) for request in requests),
+        return_exceptions=True
+    )
+
+    responses: List[Optional[VoiceGenerationResponse]] = []
+    for index, result in enumerate(results):
+        if isinstance(result, Exception):
+            _VOICE_ERROR.inc()
+            logger.error(
+                "Voice generation failed in batch",
+                correlation_id=correlation_id,
+                batch_index=index,
+                error=str(result)
+            )
+            responses.append(None)
+            continue
+
+        if result.status == 'completed':
+            _VOICE_SUCCESS.inc()
+        else:
+            _VOICE_ERROR.inc()
+        responses.append(result)
+
+    return responses
+
+@celery_app.task(
+    queue=TASK_QUEUE,
+    bind=True
+)
+async def generate_video_batch(
+    self,
+    requests: List[VideoGenerationRequest],
+    correlation_id: str
+) -> List[Optional[VideoGenerationResponse]]:
+    """
+    Celery task generating several videos concurrently over one RunwayML client.
+
+    Failed items are logged and counted individually and do not fail the batch.
+
+    Args:
+        requests: Video generation request parameters
+        correlation_id: Unique identifier for request tracking
+
+    Returns:
+        Responses in request order, None where generation raised
+    """
+    logger.info(
+        "Starting video generation batch",
+        correlation_id=correlation_id,
+        task_id=self.request.id,
+        batch_size=len(requests)
+    )
+
+    runway = _get_runway_service()
+    results = await asyncio.gather(
+        *(runway.generate_video(request) for request in requests),
+        return_exceptions=True
+    )
+
+    responses: List[Optional[VideoGenerationResponse]] = []
+    for request, result in zip(requests, results):
+        if isinstance(result, Exception):
+            _VIDEO_ERROR.inc()
+            logger.error(
+                "Video generation failed in batch",
+                correlation_id=correlation_id,
+                trade_id=request.trade_id,
+                error=str(result)
+            )
+            responses.append(None)
+            continue
+
+        if result.status == 'completed':
+            _VIDEO_SUCCESS.inc()
+        else:
+            _VIDEO_ERROR.inc()
+        responses.append(result)
+
+    return responses
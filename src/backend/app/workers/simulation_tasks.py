@@ -1,8 +1,13 @@
 # Python 3.11+
+import asyncio
 from typing import Dict, List, Any, Optional
 import numpy as np  # numpy v1.24+
 from datetime import datetime
-import hashlib
+from functools import lru_cache
+import xxhash  # xxhash v3.2+
+
+from cachetools import TTLCache  # cachetools v5.3+
+from celery.result import AsyncResult, GroupResult  # celery v5.3+
 
 from app.workers.celery_app import celery_app
 from app.ml.monte_carlo import MonteCarloSimulator
@@ -14,6 +19,9 @@ DEFAULT_N_SIMULATIONS = 10000
 CACHE_KEY_PREFIX = 'sim_task:'
 CACHE_TTL_SECONDS = 3600  # 1 hour
 MAX_PARALLEL_SIMS = 4
+LINEUP_CHUNK_SIZE = MAX_PARALLEL_SIMS * 2  # Lineups per worker invocation when chunking
+LOCAL_CACHE_MAXSIZE = 512
+LOCAL_CACHE_TTL_SECONDS = 60  # Well below CACHE_TTL_SECONDS to bound staleness
 RETRY_POLICY = {
     'max_retries': 3,
     'interval_start': 0,
@@ -21,12 +29,60 @@ RETRY_POLICY = {
     'interval_max': 0.5
 }
 
+# In-process cache of recent results in front of Redis
+_local_cache: TTLCache = TTLCache(maxsize=LOCAL_CACHE_MAXSIZE, ttl=LOCAL_CACHE_TTL_SECONDS)
+
+@lru_cache(maxsize=1)
+def _get_redis_service() -> RedisService:
+    """Return the worker-process Redis service, created on first use."""
+    return RedisService()
+
+@lru_cache(maxsize=1)
+def _get_simulator() -> MonteCarloSimulator:
+    """Return the worker-process simulator and its process pool, created on first use."""
+    return MonteCarloSimulator(
+        random_seed=SIMULATION_RANDOM_SEED,
+        n_processes=MAX_PARALLEL_SIMS
+    )
+
+def _seed_for(cache_key: str) -> np.random.SeedSequence:
+    """
+    Derive the random stream for one simulation from its cache key.
+
+    The shared simulator's own stream advances with every task, so each call gets
+    a stream keyed by its inputs instead: identical inputs give identical results
+    regardless of worker process or task history.
+    """
+    return np.random.SeedSequence(
+        SIMULATION_RANDOM_SEED,
+        spawn_key=(xxhash.xxh3_64_intdigest(cache_key.encode()),)
+    )
+
+async def _get_cached_result(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Look up a cached result in process memory first, then in Redis."""
+    cached_result = _local_cache.get(cache_key)
+    if cached_result is None:
+        cached_result = await _get_redis_service().get(cache_key)
+        if cached_result:
+            _local_cache[cache_key] = cached_result
+    return cached_result
+
+async def _cache_result(cache_key: str, results: Dict[str, Any]) -> None:
+    """Store a result in Redis and in process memory."""
+    await _get_redis_service().set(
+        key=cache_key,
+        value=results,
+        ttl=CACHE_TTL_SECONDS
+    )
+    _local_cache[cache_key] = results
+
 def generate_cache_key(prefix: str, *args) -> str:
     """Generate deterministic cache key from arguments."""
-    key_parts = [str(arg) for arg in args]
-    key_string = '_'.join(sorted(key_parts))
-    hash_object = hashlib.md5(key_string.encode())
-    return f"{CACHE_KEY_PREFIX}{prefix}:{hash_object.hexdigest()}"
+    hasher = xxhash.xxh3_64()
+    for key_part in sorted(map(str, args)):
+        hasher.update(key_part.encode())
+        hasher.update(b'\x1f')
+    return f"{CACHE_KEY_PREFIX}{prefix}:{hasher.hexdigest()}"
 
 @celery_app.task(
     name='simulate_lineup',
@@ -54,41 +110,34 @@ async def simulate_lineup_task(
     """
     # Generate cache key from sorted player IDs for consistency
     cache_key = generate_cache_key('lineup', *player_ids)
-    redis_service = RedisService()
 
     # Check cache unless force refresh requested
     if not force_refresh:
-        cached_result = await redis_service.get(cache_key)
+        cached_result = await _get_cached_result(cache_key)
         if cached_result:
             return {
                 **cached_result,
                 'cached': True,
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': datetime.utcnow()
             }
 
-    # Initialize simulator with parallel processing
-    simulator = MonteCarloSimulator(
-        random_seed=SIMULATION_RANDOM_SEED,
-        n_processes=MAX_PARALLEL_SIMS
-    )
+    # Reuse the worker's simulator with parallel processing
+    simulator = _get_simulator()
 
     # Run simulation with progress tracking
     results = await simulator.simulate_lineup_performance(
         player_ids=player_ids,
-        n_simulations=n_simulations
+        n_simulations=n_simulations,
+        seed_sequence=_seed_for(cache_key)
     )
 
     # Cache results
-    await redis_service.set(
-        key=cache_key,
-        value=results,
-        ttl=CACHE_TTL_SECONDS
-    )
+    await _cache_result(cache_key, results)
 
     return {
         **results,
         'cached': False,
-        'timestamp': datetime.utcnow().isoformat()
+        'timestamp': datetime.utcnow()
     }
 
 @celery_app.task(
@@ -119,42 +168,35 @@ async def analyze_trade_task(
     """
     # Generate cache key from trade participants
     cache_key = generate_cache_key('trade', *players_offered, *players_requested)
-    redis_service = RedisService()
 
     # Check cache unless force refresh requested
     if not force_refresh:
-        cached_result = await redis_service.get(cache_key)
+        cached_result = await _get_cached_result(cache_key)
         if cached_result:
             return {
                 **cached_result,
                 'cached': True,
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': datetime.utcnow()
             }
 
-    # Initialize simulator with parallel processing
-    simulator = MonteCarloSimulator(
-        random_seed=SIMULATION_RANDOM_SEED,
-        n_processes=MAX_PARALLEL_SIMS
-    )
+    # Reuse the worker's simulator with parallel processing
+    simulator = _get_simulator()
 
     # Run trade impact simulation
     results = await simulator.simulate_trade_impact(
         players_offered=players_offered,
         players_requested=players_requested,
-        n_simulations=n_simulations
+        n_simulations=n_simulations,
+        seed_sequence=_seed_for(cache_key)
     )
 
     # Cache analysis results
-    await redis_service.set(
-        key=cache_key,
-        value=results,
-        ttl=CACHE_TTL_SECONDS
-    )
+    await _cache_result(cache_key, results)
 
     return {
         **results,
         'cached': False,
-        'timestamp': datetime.utcnow().isoformat()
+        'timestamp': datetime.utcnow()
     }
 
 @celery_app.task(
@@ -183,39 +225,158 @@ async def simulate_season_task(
     """
     # Generate cache key from team ID and season parameters
     cache_key = generate_cache_key('season', team_id)
-    redis_service = RedisService()
 
     # Check cache unless force refresh requested
     if not force_refresh:
-        cached_result = await redis_service.get(cache_key)
+        cached_result = await _get_cached_result(cache_key)
         if cached_result:
             return {
                 **cached_result,
                 'cached': True,
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': datetime.utcnow()
             }
 
-    # Initialize simulator with distributed processing
-    simulator = MonteCarloSimulator(
-        random_seed=SIMULATION_RANDOM_SEED,
-        n_processes=MAX_PARALLEL_SIMS
-    )
+    # Reuse the worker's simulator with distributed processing
+    simulator = _get_simulator()
 
     # Run season outcome simulation
     results = await simulator.simulate_season_outcomes(
         team_id=team_id,
-        n_simulations=n_simulations
+        n_simulations=n_simulations,
+        seed_sequence=_seed_for(cache_key)
     )
 
     # Cache projection results
-    await redis_service.set(
-        key=cache_key,
-        value=results,
-        ttl=CACHE_TTL_SECONDS
-    )
+    await _cache_result(cache_key, results)
 
     return {
         **results,
         'cached': False,
-        'timestamp': datetime.utcnow().isoformat()
-    }
\ No newline at end of file
+        'timestamp': datetime.utcnow()
+    }
+
+@celery_app.task(
+    name='run_analysis_bundle',
+    queue='simulation',
+    soft_time_limit=60,
+    hard_time_limit=120,
+    retry_policy=RETRY_POLICY
+)
+async def run_analysis_bundle(
+    lineup_player_ids: List[str],
+    players_offered: List[str],
+    players_requested: List[str],
+    team_id: str,
+    n_simulations: int = DEFAULT_N_SIMULATIONS
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run lineup, trade and season analyses together, checking all three caches
+    in one round-trip and simulating only the cache misses.
+
+    Args:
+        lineup_player_ids: List of player IDs in lineup
+        players_offered: List of player IDs being offered
+        players_requested: List of player IDs being requested
+        team_id: Unique identifier for the team
+        n_simulations: Number of simulations to run
+
+    Returns:
+        Dict with 'lineup', 'trade' and 'season' results
+    """
+    cache_keys = {
+        'lineup': generate_cache_key('lineup', *lineup_player_ids),
+        'trade': generate_cache_key('trade', *players_offered, *players_requested),
+        'season': generate_cache_key('season', team_id)
+    }
+    # Serve from process memory where possible, then fetch the rest in one MGET
+    cached_results = {name: _local_cache.get(key) for name, key in cache_keys.items()}
+    remote_names = [name for name, result in cached_results.items() if result is None]
+    if remote_names:
+        remote_results = await _get_redis_service().get_many(
+            tuple(cache_keys[name] for name in remote_names)
+        )
+        for name, result in zip(remote_names, remote_results):
+            if result:
+                _local_cache[cache_keys[name]] = result
+                cached_results[name] = result
+
+    timestamp = datetime.utcnow()
+    bundle: Dict[str, Dict[str, Any]] = {}
+    for name, cached_result in cached_results.items():
+        if cached_result:
+            bundle[name] = {**cached_result, 'cached': True, 'timestamp': timestamp}
+
+    # Simulate misses concurrently; the task bodies cache their own results
+    pending = {}
+    if 'lineup' not in bundle:
+        pending['lineup'] = simulate_lineup_task(
+            lineup_player_ids, n_simulations, force_refresh=True
+        )
+    if 'trade' not in bundle:
+        pending['trade'] = analyze_trade_task(
+            players_offered, players_requested, n_simulations, force_refresh=True
+        )
+    if 'season' not in bundle:
+        pending['season'] = simulate_season_task(
+            team_id, n_simulations, force_refresh=True
+        )
+
+    if pending:
+        results = await asyncio.gather(*pending.values())
+        bundle.update(zip(pending, results))
+
+    return bundle
+
+def enqueue_lineups(
+    lineups: List[List[str]],
+    n_simulations: int = DEFAULT_N_SIMULATIONS,
+    force_refresh: bool = False
+) -> List[AsyncResult]:
+    """
+    Enqueue lineup simulations in bulk over a single broker producer.
+
+    Publishing through one acquired producer reuses the same connection and
+    channel for every message instead of acquiring one per apply_async call.
+
+    Args:
+        lineups: Player ID lists, one per lineup to simulate
+        n_simulations: Number of simulations to run per lineup
+        force_refresh: Whether to bypass cache
+
+    Returns:
+        List of AsyncResult handles in lineup order
+    """
+    with celery_app.producer_or_acquire() as producer:
+        return [
+            simulate_lineup_task.apply_async(
+                args=(player_ids,),
+                kwargs={'n_simulations': n_simulations, 'force_refresh': force_refresh},
+                producer=producer
+            )
+            for player_ids in lineups
+        ]
+
+def enqueue_lineup_chunks(
+    lineups: List[List[str]],
+    chunk_size: int = LINEUP_CHUNK_SIZE,
+    n_simulations: int = DEFAULT_N_SIMULATIONS
+) -> GroupResult:
+    """
+    Enqueue lineup simulations batched into Celery chunks.
+
+    Each chunk runs chunk_size lineups in a single worker invocation, so broker
+    messages scale with len(lineups) / chunk_size. Larger chunks trade away
+    parallelism across workers; keep chunk_size at or below LINEUP_CHUNK_SIZE.
+
+    Args:
+        lineups: Player ID lists, one per lineup to simulate
+        chunk_size: Number of lineups per chunk
+        n_simulations: Number of simulations to run per lineup
+
+    Returns:
+        GroupResult whose children each yield the list of results for one chunk
+    """
+    return simulate_lineup_task.chunks(
+        ((player_ids, n_simulations) for player_ids in lineups),
+        chunk_size
+    ).apply_async()
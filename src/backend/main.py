@@ -1,9 +1,15 @@
 # Python 3.11+
+import asyncio
 import logging
+import socket
+import sys
 from contextlib import asynccontextmanager
-from typing import Dict, Any
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
 
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Request
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.authentication import AuthenticationMiddleware
@@ -11,11 +17,14 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi_limiter import FastAPILimiter
 from ddtrace.middleware.asgi import DatadogMiddleware
 from firebase_admin import initialize_app
+import msgspec  # msgspec v0.18+
 import redis.asyncio as redis
+import uvloop  # uvloop v0.17+
 
 from app.core.config import settings
 from app.api.v1 import api_router
 from app.core.exceptions import (
+    BaseAppException,
     AuthenticationError,
     ValidationError,
     RateLimitError,
@@ -23,17 +32,54 @@ from app.core.exceptions import (
     IntegrationError
 )
 from app.core.logging import setup_logging, get_logger
+from app.core.middleware import (
+    RequestIDMiddleware,
+    ProcessTimeMiddleware,
+    SelectiveAuthMiddleware
+)
+from app.services import cleanup_services
+
+# Run every event loop created by this process on libuv
+uvloop.install()
 
 # Initialize logging
 setup_logging()
 logger = get_logger(__name__)
 
-# Initialize Redis client
-redis_client = redis.from_url(
+# Patch integrations for Datadog APM once at process start, before workers accept requests
+if settings.ENABLE_TELEMETRY:
+    from ddtrace import patch_all
+    patch_all(logging=True, redis=True, sqlalchemy=True, fastapi=True)
+    logger.info("Datadog APM initialized successfully")
+
+# Redis connection pool limits (bounded so rate-limit bursts wait instead of opening sockets)
+REDIS_MAX_CONNECTIONS = 64
+REDIS_POOL_TIMEOUT = 5  # Seconds to wait for a free connection
+REDIS_KEEPALIVE_OPTIONS = {
+    socket.TCP_KEEPIDLE: 60,
+    socket.TCP_KEEPINTVL: 15,
+    socket.TCP_KEEPCNT: 4
+}
+
+# Initialize Redis client on a bounded, keepalive connection pool
+redis_pool = redis.BlockingConnectionPool.from_url(
     settings.REDIS_URL,
+    max_connections=REDIS_MAX_CONNECTIONS,
+    timeout=REDIS_POOL_TIMEOUT,
+    socket_keepalive=True,
+    socket_keepalive_options=REDIS_KEEPALIVE_OPTIONS,
     encoding="utf-8",
     decode_responses=True
 )
+redis_client = redis.Redis(connection_pool=redis_pool)
+
+# Smallest response body worth compressing in-process; small JSON is cheaper to send as-is
+GZIP_MINIMUM_SIZE = 8192
+
+# Prebuilt OpenAPI spec written by scripts/generate_openapi.py
+OPENAPI_URL = f"{settings.API_V1_STR}/openapi.json"
+OPENAPI_SPEC_PATH = Path("docs/api/openapi.json")
+OPENAPI_CACHE_CONTROL = "public, max-age=3600"
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -42,6 +88,12 @@ async def lifespan(app: FastAPI):
     Handles initialization and cleanup of services.
     """
     try:
+        logger.info(f"Event loop policy: {type(asyncio.get_event_loop_policy()).__name__}")
+
+        # Run new tasks inline until their first suspension (Python 3.12+)
+        if sys.version_info >= (3, 12):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
         # Initialize Firebase Admin SDK
         firebase_creds = settings.get_firebase_credentials()
         initialize_app(firebase_creds)
@@ -51,12 +103,6 @@ async def lifespan(app: FastAPI):
         await FastAPILimiter.init(redis_client)
         logger.info("Rate limiter initialized successfully")
 
-        # Initialize Datadog APM if enabled
-        if settings.ENABLE_TELEMETRY:
-            from ddtrace import patch_all
-            patch_all()
-            logger.info("Datadog APM initialized successfully")
-
         yield
 
     except Exception as e:
@@ -64,71 +110,123 @@ async def lifespan(app: FastAPI):
         raise
     finally:
         # Cleanup
+        await cleanup_services()
         await redis_client.close()
+        await redis_pool.disconnect()
         logger.info("Application shutdown complete")
 
 # Initialize FastAPI application
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json",
-    docs_url=f"{settings.API_V1_STR}/docs",
-    redoc_url=f"{settings.API_V1_STR}/redoc",
+    # Schema and docs routes are served by configure_openapi() from the prebuilt spec
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
     debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-def configure_cors() -> None:
-    """Configure CORS middleware with security headers."""
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=[origin.strip() for origin in settings.ALLOWED_HOSTS],
-        allow_credentials=True,
-        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
-        allow_headers=[
-            "Authorization",
-            "Content-Type",
-            "X-Request-ID",
-            "X-Real-IP",
-            "X-Forwarded-For"
-        ],
-        expose_headers=[
-            "X-Process-Time",
-            "X-Rate-Limit-Limit",
-            "X-Rate-Limit-Remaining",
-            "X-Rate-Limit-Reset"
-        ],
-        max_age=600  # 10 minutes
-    )
+# Share the pooled Redis client with request handlers
+app.state.redis = redis_client
 
-def configure_middleware() -> None:
-    """Configure all required middleware for production deployment."""
+# CORS policy for browser clients
+CORS_OPTIONS: Dict[str, Any] = {
+    "allow_origins": [origin.strip() for origin in settings.ALLOWED_HOSTS],
+    "allow_credentials": True,
+    "allow_methods": ("GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"),
+    "allow_headers": (
+        "Authorization",
+        "Content-Type",
+        "X-Request-ID",
+        "X-Real-IP",
+        "X-Forwarded-For"
+    ),
+    "expose_headers": (
+        "X-Process-Time-Us",
+        "X-Rate-Limit-Limit",
+        "X-Rate-Limit-Remaining",
+        "X-Rate-Limit-Reset"
+    ),
+    "max_age": 600  # 10 minutes
+}
+
+# Path prefixes served without authentication (docs, schema and health checks)
+AUTH_EXEMPT_PATHS = (
+    f"{settings.API_V1_STR}/docs",
+    f"{settings.API_V1_STR}/redoc",
+    f"{settings.API_V1_STR}/openapi.json",
+    f"{settings.API_V1_STR}/health",
+    "/healthz"
+)
+
+def build_middleware_stack() -> List[Tuple[type, Dict[str, Any]]]:
+    """
+    Build the full middleware stack in registration order.
+
+    Starlette wraps each added middleware around the previous ones, so the list
+    runs innermost first: the last entry sees a request first.
+
+    Returns:
+        List[Tuple[type, Dict[str, Any]]]: Middleware classes with their options
+    """
     # Security middleware
-    app.add_middleware(TrustedHostMiddleware, allowed_hosts=settings.ALLOWED_HOSTS)
-    app.add_middleware(AuthenticationMiddleware)
-    
-    # Performance middleware
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
-    
+    stack: List[Tuple[type, Dict[str, Any]]] = [
+        (CORSMiddleware, CORS_OPTIONS),
+        (TrustedHostMiddleware, {"allowed_hosts": settings.ALLOWED_HOSTS}),
+        (SelectiveAuthMiddleware, {
+            "auth_middleware": AuthenticationMiddleware,
+            "exempt_paths": AUTH_EXEMPT_PATHS
+        })
+    ]
+
+    # Performance middleware (skipped when the reverse proxy compresses responses)
+    if settings.EDGE_COMPRESSION_ENABLED:
+        logger.info("Response compression delegated to the edge proxy")
+    else:
+        stack.append((GZipMiddleware, {"minimum_size": GZIP_MINIMUM_SIZE}))
+        logger.info(f"Response compression handled in-process for bodies >= {GZIP_MINIMUM_SIZE} bytes")
+
     # Monitoring middleware
     if settings.ENABLE_TELEMETRY:
-        app.add_middleware(DatadogMiddleware)
-    
-    # Request ID middleware
-    @app.middleware("http")
-    async def add_request_id(request: Request, call_next) -> Response:
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-        return response
-    
-    # Performance tracking middleware
-    @app.middleware("http")
-    async def add_process_time(request: Request, call_next) -> Response:
-        start_time = time.time()
-        response = await call_next(request)
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
-        return response
+        stack.append((DatadogMiddleware, {}))
+
+    # Request tracing middleware (pure ASGI, no per-request task overhead)
+    stack.append((ProcessTimeMiddleware, {"redis": redis_client}))
+    stack.append((RequestIDMiddleware, {}))
+
+    return stack
+
+def configure_middleware() -> None:
+    """Register the whole middleware stack in a single pass."""
+    for middleware_class, options in build_middleware_stack():
+        app.add_middleware(middleware_class, **options)
+
+# Shared encoder for error payloads
+_error_encoder = msgspec.json.Encoder()
+
+def error_response(
+    exc: BaseAppException,
+    status_code: int,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Encode an application exception's payload straight to a JSON response.
+
+    Args:
+        exc: Application exception to render
+        status_code: HTTP status code for the response
+        headers: Optional extra response headers
+
+    Returns:
+        Response: JSON error response
+    """
+    return Response(
+        content=_error_encoder.encode(exc.payload),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json"
+    )
 
 def configure_error_handlers() -> None:
     """Configure global error handlers for different exception types."""
@@ -136,53 +234,54 @@ def configure_error_handlers() -> None:
     @app.exception_handler(ValidationError)
     async def validation_error_handler(request: Request, exc: ValidationError) -> Response:
         logger.warning(f"Validation error: {exc.message}", extra=exc.to_dict())
-        return Response(
-            status_code=422,
-            content=exc.to_dict(),
-            media_type="application/json"
-        )
+        return error_response(exc, 422)
     
     @app.exception_handler(AuthenticationError)
     async def auth_error_handler(request: Request, exc: AuthenticationError) -> Response:
         logger.error(f"Authentication error: {exc.message}", extra=exc.to_dict())
-        return Response(
-            status_code=401,
-            content=exc.to_dict(),
-            media_type="application/json"
-        )
+        return error_response(exc, 401)
     
     @app.exception_handler(RateLimitError)
     async def rate_limit_handler(request: Request, exc: RateLimitError) -> Response:
         logger.warning(f"Rate limit exceeded: {exc.message}", extra=exc.to_dict())
-        return Response(
-            status_code=429,
-            content=exc.to_dict(),
-            headers={"Retry-After": "60"},
-            media_type="application/json"
-        )
+        return error_response(exc, 429, headers={"Retry-After": "60"})
     
     @app.exception_handler(IntegrationError)
     async def integration_error_handler(request: Request, exc: IntegrationError) -> Response:
         logger.error(f"Integration error: {exc.message}", extra=exc.to_dict())
-        return Response(
-            status_code=502,
-            content=exc.to_dict(),
-            media_type="application/json"
-        )
+        return error_response(exc, 502)
     
     @app.exception_handler(SystemError)
     async def system_error_handler(request: Request, exc: SystemError) -> Response:
         logger.error(f"System error: {exc.message}", extra=exc.to_dict())
-        return Response(
-            status_code=500,
-            content=exc.to_dict(),
-            media_type="application/json"
-        )
+        return error_response(exc, 500)
+
+def configure_openapi() -> None:
+    """Serve the OpenAPI spec from the prebuilt file instead of regenerating it per worker."""
+
+    @app.get(OPENAPI_URL, include_in_schema=False)
+    async def openapi_spec():
+        if OPENAPI_SPEC_PATH.is_file():
+            return FileResponse(
+                OPENAPI_SPEC_PATH,
+                media_type="application/json",
+                headers={"Cache-Control": OPENAPI_CACHE_CONTROL}
+            )
+        # Fall back to the generated schema when the spec has not been built
+        return ORJSONResponse(app.openapi())
+
+    @app.get(f"{settings.API_V1_STR}/docs", include_in_schema=False)
+    async def swagger_ui() -> HTMLResponse:
+        return get_swagger_ui_html(openapi_url=OPENAPI_URL, title=f"{settings.PROJECT_NAME} - Docs")
+
+    @app.get(f"{settings.API_V1_STR}/redoc", include_in_schema=False)
+    async def redoc() -> HTMLResponse:
+        return get_redoc_html(openapi_url=OPENAPI_URL, title=f"{settings.PROJECT_NAME} - ReDoc")
 
 # Configure application
-configure_cors()
 configure_middleware()
 configure_error_handlers()
+configure_openapi()
 
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
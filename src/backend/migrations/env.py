@@ -1,17 +1,23 @@
 # Python 3.11+
 import logging
+import os
 from logging.config import fileConfig
-from typing import Dict
 
 from alembic import context  # alembic v1.5+
-from sqlalchemy import engine_from_config, pool  # sqlalchemy v1.4+
 from sqlalchemy.engine import Connection
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql.schema import MetaData
 
-from app.core.config import settings
+# Offline runs only render SQL, so they read the environment and never import the
+# app package (FastAPI, Redis, routers); online runs use the application settings
+if context.is_offline_mode():
+    LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+else:
+    from app.core.config import settings
+    LOG_LEVEL = settings.LOG_LEVEL
 
 # Initialize logging
-logging.basicConfig(level=settings.LOG_LEVEL)
+logging.basicConfig(level=LOG_LEVEL)
 logger = logging.getLogger("alembic.env")
 
 # Load alembic.ini config
@@ -21,50 +27,34 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# Set SQLAlchemy URL from settings
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
-
-# Import all models here for Alembic to detect
-from app.models.base import Base  # noqa
-target_metadata = Base.metadata
+# Migration sessions get a statement timeout and their own application name
+MIGRATION_CONNECT_ARGS = {
+    'options': '-c statement_timeout=60000',  # 60 seconds
+    'application_name': 'fantasy_gm_migrations'
+}
+MIGRATION_POOL_TIMEOUT = 30
 
-# Connection pool settings
-POOL_SIZE = 5
-MAX_OVERFLOW = 10
-POOL_RECYCLE = 3600  # 1 hour
-POOL_TIMEOUT = 30
-
-def get_engine_config() -> Dict:
+def _load_metadata() -> MetaData:
     """
-    Creates SQLAlchemy engine configuration with optimized connection pooling settings.
-    
+    Imports the model registry for Alembic to detect.
+
     Returns:
-        Dict: Engine configuration dictionary with pool settings
+        MetaData: Metadata of all application models
     """
-    return {
-        'sqlalchemy.pool_size': POOL_SIZE,
-        'sqlalchemy.max_overflow': MAX_OVERFLOW,
-        'sqlalchemy.pool_recycle': POOL_RECYCLE,
-        'sqlalchemy.pool_timeout': POOL_TIMEOUT,
-        'sqlalchemy.pool_pre_ping': True,
-        'sqlalchemy.echo': settings.DEBUG,
-        'sqlalchemy.pool_class': pool.QueuePool,
-        'sqlalchemy.connect_args': {
-            'statement_timeout': 60000,  # 60 seconds
-            'application_name': 'fantasy_gm_migrations'
-        }
-    }
+    from app.models.base import Base  # noqa
+    return Base.metadata
 
 def run_migrations_offline() -> None:
     """
     Executes database migrations in offline mode for generating SQL scripts.
-    Useful for generating migration SQL without database connection.
+    Useful for generating migration SQL without database connection. Takes the URL
+    from DATABASE_URL, falling back to alembic.ini, and needs no model metadata.
     """
     try:
-        url = config.get_main_option("sqlalchemy.url")
+        url = os.environ.get("DATABASE_URL") or config.get_main_option("sqlalchemy.url")
         context.configure(
             url=url,
-            target_metadata=target_metadata,
+            target_metadata=None,
             literal_binds=True,
             dialect_opts={"paramstyle": "named"},
             compare_type=True,
@@ -82,28 +72,31 @@ def run_migrations_offline() -> None:
 def run_migrations_online() -> None:
     """
     Executes database migrations in online mode with active connection and enhanced error handling.
-    Implements connection pooling and transaction management for safe migrations.
+    Uses the shared engine tuning with migration connect args and transaction management for safe migrations.
     """
-    # Update engine configuration with pooling settings
-    configuration = config.get_section(config.config_ini_section)
-    configuration.update(get_engine_config())
-    
-    connectable = engine_from_config(
-        configuration,
-        prefix="sqlalchemy.",
-        poolclass=pool.QueuePool
+    from app.db.engine import create_db_engine
+
+    # Shared pool and keepalive tuning, plus the migration session settings
+    connectable = create_db_engine(
+        settings.DATABASE_URL,
+        connect_args=MIGRATION_CONNECT_ARGS,
+        pool_timeout=MIGRATION_POOL_TIMEOUT
     )
+    target_metadata = _load_metadata()
 
     try:
         with connectable.connect() as connection:
+            # Batch mode and per-migration transactions only help SQLite; on Postgres
+            # run every pending migration in one transaction with native ALTERs
+            is_sqlite = connection.dialect.name == "sqlite"
             context.configure(
                 connection=connection,
                 target_metadata=target_metadata,
                 compare_type=True,
                 compare_server_default=True,
                 include_schemas=True,
-                transaction_per_migration=True,
-                render_as_batch=True
+                transaction_per_migration=is_sqlite,
+                render_as_batch=is_sqlite
             )
 
             with context.begin_transaction():
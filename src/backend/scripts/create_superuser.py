@@ -1,14 +1,20 @@
 #!/usr/bin/env python3
 # Python 3.11+
 
+import os
+
+# Skip the Datadog profiler bootstrap; telemetry is pure overhead for one-off scripts
+os.environ.setdefault("DD_PROFILING_ENABLED", "false")
+
 import click
 import re
 import getpass
-from sqlalchemy import create_engine
+from sqlalchemy import select
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.core.config import settings, PROJECT_NAME
+from app.core.config import PROJECT_NAME
+from app.db.engine import get_engine
 from app.models.user import User
 from app.core.security import get_password_hash
 from app.core.logging import get_logger
@@ -21,6 +27,10 @@ EMAIL_REGEX = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
 PASSWORD_MIN_LENGTH = 12
 MAX_LOGIN_ATTEMPTS = 3
 
+# Precompiled validation patterns
+_EMAIL_RE = re.compile(EMAIL_REGEX)
+_SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
 def validate_email(email: str) -> bool:
     """
     Validate email format using regex pattern.
@@ -31,7 +41,7 @@ def validate_email(email: str) -> bool:
     Returns:
         bool: True if email is valid, False otherwise
     """
-    return bool(re.match(EMAIL_REGEX, email))
+    return bool(_EMAIL_RE.match(email))
 
 def validate_password(password: str) -> bool:
     """
@@ -45,25 +55,16 @@ def validate_password(password: str) -> bool:
     """
     if len(password) < PASSWORD_MIN_LENGTH:
         return False
-    
-    # Check for at least one uppercase letter
-    if not any(c.isupper() for c in password):
-        return False
-    
-    # Check for at least one lowercase letter
-    if not any(c.islower() for c in password):
-        return False
-    
-    # Check for at least one digit
-    if not any(c.isdigit() for c in password):
-        return False
-    
-    # Check for at least one special character
-    special_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"
-    if not any(c in special_chars for c in password):
-        return False
-    
-    return True
+
+    # Single pass over the password for every character class
+    has_upper = has_lower = has_digit = has_special = False
+    for c in password:
+        has_upper |= c.isupper()
+        has_lower |= c.islower()
+        has_digit |= c.isdigit()
+        has_special |= c in _SPECIAL_CHARS
+
+    return has_upper and has_lower and has_digit and has_special
 
 @click.command()
 @click.option('--email', prompt=True, help='Superuser email address')
@@ -84,13 +85,12 @@ def create_superuser(email: str, name: str) -> None:
             return
 
         # Initialize database connection
-        engine = create_engine(settings.DATABASE_URL)
-        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
         db = SessionLocal()
 
-        # Check if superuser already exists
-        existing_user = db.query(User).filter(User.email == email.lower()).first()
-        if existing_user:
+        # Check if superuser already exists (index probe, no row hydration)
+        exists_stmt = select(1).where(User.email == email.lower()).limit(1)
+        if db.execute(exists_stmt).scalar() is not None:
             logger.warning(f"Attempted to create duplicate superuser: {email}")
             click.echo("Error: A user with this email already exists.")
             return
@@ -125,7 +125,7 @@ def create_superuser(email: str, name: str) -> None:
             click.echo("Error: Maximum password attempts exceeded. Please try again later.")
             return
 
-        # Create superuser
+        # Create superuser (sync CLI; async callers must use app.core.security.hash_password)
         hashed_password = get_password_hash(password)
         superuser = User(
             email=email.lower(),
@@ -2,7 +2,7 @@
 import click  # click v8.0+
 import logging
 import sys
-from datetime import datetime
+import time
 from typing import Optional
 
 from alembic.util.exc import CommandError
@@ -53,7 +53,7 @@ def run_migrations(offline: bool = False) -> None:
     Args:
         offline (bool): Flag to run migrations in offline mode
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     exit_code = 0
     
     try:
@@ -75,7 +75,7 @@ def run_migrations(offline: bool = False) -> None:
             run_migrations_online()
         
         # Calculate execution time
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
         logger.info(f"Migrations completed successfully in {execution_time:.2f} seconds")
         
     except SQLAlchemyError as e:
@@ -98,7 +98,7 @@ def run_migrations(offline: bool = False) -> None:
             logger.info(
                 "Migration encountered errors. Please check logs and database state."
             )
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             logger.info(f"Migration process ended after {execution_time:.2f} seconds")
         sys.exit(exit_code)
 
@@ -5,14 +5,14 @@ across NFL, NBA, and MLB leagues with platform-specific mappings and validations
 
 # Python 3.11+
 import asyncio
-import json
 import logging
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
-from uuid import uuid4
-
-import aiofiles  # v23.1+
-from sqlalchemy.ext.asyncio import AsyncSession  # v2.0+
+from typing import Any, Dict, List, Optional, Tuple
+import orjson  # v3.9+
+from uuid6 import uuid7  # v2023.5+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # v2.0+
 
 from app.models.team import Team
 from app.models.player import Player
@@ -25,7 +25,20 @@ logging.basicConfig(level=logging.INFO)
 
 # Constants
 SEED_DATA_PATH = Path('data/seed')
-BATCH_SIZE = settings.BATCH_SIZE or 1000
+INSERT_PAGE_SIZE = 1000  # Rows per multi-row INSERT statement
+COPY_THRESHOLD = 100  # Datasets at least this large are streamed with COPY instead of the ORM
+
+# Per-row lookups hoisted out of the seeding loops
+POSITIONS = PlayerPosition.__members__
+DEFAULT_SOCIAL_SENTIMENT = {'score': 0.0, 'trend': 'neutral', 'mentions': 0}
+DEFAULT_SOCIAL_SENTIMENT_JSON = orjson.dumps(DEFAULT_SOCIAL_SENTIMENT).decode()
+
+# Column order for COPY into the players table; COPY bypasses ORM defaults, so every column is set
+PLAYER_COPY_COLUMNS = (
+    'id', 'name', 'external_id', 'sport', 'position', 'team', 'status',
+    'stats', 'projections', 'historical_stats', 'injury_history',
+    'social_sentiment', 'created_at', 'updated_at'
+)
 
 class DataValidationError(Exception):
     """Custom exception for data validation errors."""
@@ -45,13 +58,58 @@ async def load_json_file(file_path: Path) -> Dict:
         DataValidationError: If file loading or validation fails
     """
     try:
-        async with aiofiles.open(file_path, mode='r') as f:
-            content = await f.read()
-            return json.loads(content)
+        content = await asyncio.to_thread(file_path.read_bytes)
+        return orjson.loads(content)
     except Exception as e:
         logger.error(f"Error loading {file_path}: {str(e)}")
         raise DataValidationError(f"Failed to load seed data: {str(e)}")
 
+def _player_record(player_data: Dict, sport: SportType, timestamp: datetime) -> Tuple[Any, ...]:
+    """
+    Builds a players row in PLAYER_COPY_COLUMNS order with JSON columns pre-serialized.
+
+    Args:
+        player_data (Dict): Raw player seed entry
+        sport (SportType): Sport the player belongs to
+        timestamp (datetime): Creation time for the row
+
+    Returns:
+        Tuple[Any, ...]: Row values for COPY
+    """
+    social_sentiment = player_data.get('social_sentiment')
+    return (
+        uuid7(),
+        player_data['name'],
+        player_data['external_id'],
+        sport.name,
+        POSITIONS[player_data['position']].name,
+        player_data['team'],
+        'ACTIVE',
+        orjson.dumps(player_data.get('stats', {})).decode(),
+        orjson.dumps(player_data.get('projections', {})).decode(),
+        '[]',
+        orjson.dumps(player_data.get('injury_history', [])).decode(),
+        orjson.dumps(social_sentiment).decode() if social_sentiment else DEFAULT_SOCIAL_SENTIMENT_JSON,
+        timestamp,
+        timestamp
+    )
+
+async def copy_players(session: AsyncSession, records: List[Tuple[Any, ...]]) -> None:
+    """
+    Streams player rows into PostgreSQL with asyncpg's binary COPY protocol.
+
+    Args:
+        session (AsyncSession): Database session
+        records (List[Tuple[Any, ...]]): Rows in PLAYER_COPY_COLUMNS order
+    """
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        Player.__tablename__,
+        records=records,
+        columns=PLAYER_COPY_COLUMNS
+    )
+
 async def seed_teams(session: AsyncSession) -> None:
     """
     Seeds sample fantasy teams with platform-specific configurations.
@@ -71,25 +129,28 @@ async def seed_teams(session: AsyncSession) -> None:
             for platform in [Platform.ESPN, Platform.SLEEPER]:
                 platform_teams = teams_data.get(sport.value, {}).get(platform.value, [])
                 
-                for team_data in platform_teams:
-                    team = Team(
-                        id=uuid4(),
-                        name=team_data['name'],
-                        sport=sport,
-                        platform=platform,
-                        settings={
+                if not platform_teams:
+                    continue
+
+                # One multi-row INSERT per platform; column defaults fill the remaining fields.
+                # Time-ordered UUIDv7 keys keep primary key index inserts append-only
+                await session.execute(insert(Team), [
+                    {
+                        'id': uuid7(),
+                        'name': team_data['name'],
+                        'sport': sport,
+                        'platform': platform,
+                        'settings': {
                             'scoring_type': team_data.get('scoring_type', 'standard'),
                             'roster_size': team_data.get('roster_size', 16),
                             'platform_team_id': team_data.get('platform_id'),
                             'draft_position': team_data.get('draft_position'),
                             'league_size': team_data.get('league_size', 12)
                         }
-                    )
-                    session.add(team)
-                    
-                if len(platform_teams) > 0:
-                    await session.flush()
-                    logger.info(f"Seeded {len(platform_teams)} teams for {sport.value} on {platform.value}")
+                    }
+                    for team_data in platform_teams
+                ])
+                logger.info(f"Seeded {len(platform_teams)} teams for {sport.value} on {platform.value}")
         
         await session.commit()
         logger.info("Team seeding completed successfully")
@@ -112,16 +173,31 @@ async def seed_players(session: AsyncSession) -> None:
     logger.info("Starting player seeding process...")
     
     try:
-        for sport in settings.SUPPORTED_SPORTS:
-            players_data = await load_json_file(SEED_DATA_PATH / f'players_{sport.value.lower()}.json')
-            batch = []
-            
+        # Load every sport's file concurrently before inserting
+        sports = tuple(settings.SUPPORTED_SPORTS)
+        datasets = await asyncio.gather(*(
+            load_json_file(SEED_DATA_PATH / f'players_{sport.value.lower()}.json')
+            for sport in sports
+        ))
+
+        for sport, players_data in zip(sports, datasets):
+            # Large datasets skip the ORM and stream in one COPY round trip
+            if len(players_data) >= COPY_THRESHOLD:
+                timestamp = datetime.utcnow()
+                await copy_players(
+                    session,
+                    [_player_record(player_data, sport, timestamp) for player_data in players_data]
+                )
+                logger.info(f"Seeded {len(players_data)} players for {sport.value}")
+                continue
+
+            players = []
             for player_data in players_data:
                 player = Player(
                     name=player_data['name'],
                     external_id=player_data['external_id'],
                     sport=sport,
-                    position=PlayerPosition[player_data['position']],
+                    position=POSITIONS[player_data['position']],
                     team=player_data['team'],
                     initial_stats=player_data.get('stats', {}),
                     initial_projections=player_data.get('projections', {})
@@ -129,22 +205,12 @@ async def seed_players(session: AsyncSession) -> None:
                 
                 # Set additional metadata
                 player.injury_history = player_data.get('injury_history', [])
-                player.social_sentiment = player_data.get('social_sentiment', {
-                    'score': 0.0,
-                    'trend': 'neutral',
-                    'mentions': 0
-                })
+                player.social_sentiment = player_data.get('social_sentiment') or dict(DEFAULT_SOCIAL_SENTIMENT)
                 
-                batch.append(player)
-                
-                if len(batch) >= BATCH_SIZE:
-                    session.add_all(batch)
-                    await session.flush()
-                    batch = []
-                    
-            if batch:
-                session.add_all(batch)
-                await session.flush()
+                players.append(player)
+
+            # Flushed once by the final commit; rollback on failure covers partial work
+            session.add_all(players)
                 
             logger.info(f"Seeded {len(players_data)} players for {sport.value}")
         
@@ -195,11 +261,17 @@ async def main() -> None:
     """
     Main entry point for database seeding with enhanced error handling.
     """
+    # Multi-row INSERTs are paged at INSERT_PAGE_SIZE rows per statement
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        insertmanyvalues_page_size=INSERT_PAGE_SIZE
+    )
+
     try:
         logger.info("Starting database seeding process...")
         
         # Initialize database session
-        async with AsyncSession() as session:
+        async with AsyncSession(engine) as session:
             # Seed teams first to establish relationships
             await seed_teams(session)
             
@@ -215,6 +287,8 @@ async def main() -> None:
     except Exception as e:
         logger.error(f"Database seeding failed: {str(e)}")
         raise
+    finally:
+        await engine.dispose()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -26,10 +26,10 @@ def event_loop():
     yield loop
     loop.close()
 
-@pytest_asyncio.fixture(scope="function")
-async def test_redis():
+@pytest_asyncio.fixture(scope="session")
+async def _redis_singleton():
     """
-    Creates an isolated Redis instance for testing with TTL support.
+    Creates one FakeRedis instance shared by the whole test session.
     
     Returns:
         FakeRedis instance configured for testing
@@ -38,10 +38,23 @@ async def test_redis():
         decode_responses=True,
         protocol_version=3
     )
-    await redis.flushall()
     yield redis
     await redis.close()
 
+@pytest_asyncio.fixture(scope="function")
+async def test_redis(_redis_singleton):
+    """
+    Provides the shared Redis instance, flushed so each test starts isolated.
+    
+    Args:
+        _redis_singleton: Session-wide FakeRedis instance
+        
+    Returns:
+        FakeRedis instance configured for testing
+    """
+    await _redis_singleton.flushall()
+    yield _redis_singleton
+
 @pytest_asyncio.fixture(scope="function")
 async def test_firebase():
     """
@@ -9,7 +9,8 @@ from app.workers.analytics_tasks import (
     process_user_analytics,
     update_performance_metrics,
     aggregate_sport_analytics,
-    track_ai_metrics
+    track_ai_metrics,
+    _local_cache
 )
 from app.models.analytics import UserAnalytics, PerformanceMetrics, SportAnalytics, AIMetrics
 from app.utils.enums import SportType
@@ -31,6 +32,7 @@ TEST_SESSION_DATA = {
 
 TEST_PERFORMANCE_DATA = {
     'response_times': [1.5, 1.8, 1.2, 2.1],
+    'latency_histogram': {5: 400, 6: 350, 8: 250},
     'cpu_usage': 45.5,
     'memory_usage': 2048,
     'error_count': 2,
@@ -65,8 +67,13 @@ def mock_redis():
     """Fixture for mocking Redis service."""
     with patch('app.workers.analytics_tasks.redis_service') as mock:
         mock.get = AsyncMock()
+        mock.get_many = AsyncMock()
+        mock.pop_histogram = AsyncMock()
         mock.set = AsyncMock()
+        mock.set_hash = AsyncMock()
+        _local_cache.clear()
         yield mock
+        _local_cache.clear()
 
 @pytest.fixture
 def mock_db():
@@ -118,7 +125,7 @@ async def test_update_performance_metrics(mock_perf_metrics, mock_redis, mock_db
     # Setup mocks
     mock_metrics = MagicMock()
     mock_perf_metrics.return_value = mock_metrics
-    mock_redis.get.return_value = TEST_PERFORMANCE_DATA['response_times']
+    mock_redis.pop_histogram.return_value = TEST_PERFORMANCE_DATA['latency_histogram']
 
     # Test successful metrics update
     result = await update_performance_metrics()
@@ -133,8 +140,13 @@ async def test_update_performance_metrics(mock_perf_metrics, mock_redis, mock_db
     assert 'response_times' in result['api_metrics']
     assert result['api_metrics']['request_count'] == TEST_PERFORMANCE_DATA['request_count']
 
+    # Verify percentiles come from this interval's latency histogram in a single round-trip
+    mock_redis.pop_histogram.assert_called_once_with('api_latency_histogram')
+    response_times = result['api_metrics']['response_times']
+    assert response_times['p50'] <= response_times['p95'] <= response_times['p99']
+
     # Test error handling
-    mock_redis.get.side_effect = IntegrationError("Redis error")
+    mock_redis.pop_histogram.side_effect = IntegrationError("Redis error")
     with pytest.raises(IntegrationError):
         await update_performance_metrics()
 
@@ -160,10 +172,11 @@ async def test_aggregate_sport_analytics(mock_sport_analytics, mock_redis, mock_
     assert 'league_trends' in result
 
     # Test cache operations
-    mock_redis.set.assert_called_once()
+    mock_redis.set_hash.assert_called_once()
+    assert 'league_trends' in mock_redis.set_hash.call_args.kwargs['mapping']
 
     # Test error handling
-    mock_redis.set.side_effect = IntegrationError("Redis error")
+    mock_redis.set_hash.side_effect = IntegrationError("Redis error")
     with pytest.raises(IntegrationError):
         await aggregate_sport_analytics(
             sport_type=TEST_SPORT_DATA['sport_type'],
@@ -0,0 +1,66 @@
+# Python 3.11+
+import pytest
+from unittest.mock import patch
+
+from app.workers import (
+    celery_app,
+    MonitoredTask,
+    SLOW_TASK_THRESHOLD_SECONDS
+)
+
+# Test constants
+TEST_TASK_ID = 'monitored-task-test'
+TEST_START_TIME = 1000.0
+
+@celery_app.task(name='tests.monitored_noop')
+def monitored_noop() -> None:
+    """No-op task used to exercise MonitoredTask hooks."""
+    return None
+
+@pytest.fixture
+def monitored_task():
+    """Fixture providing the no-op task with fresh metrics and an active request."""
+    task = monitored_noop
+    task.metrics['success_count'] = 0
+    task.metrics['processing_times'].clear()
+    task.push_request(id=TEST_TASK_ID, kwargs={})
+    yield task
+    task.pop_request()
+
+def _run_hooks(task: MonitoredTask, elapsed: float) -> None:
+    """Drive before_start and on_success with a controlled clock."""
+    with patch(
+        'app.workers.time.perf_counter',
+        side_effect=[TEST_START_TIME, TEST_START_TIME + elapsed]
+    ):
+        task.before_start(TEST_TASK_ID, (), {})
+        task.on_success(None, TEST_TASK_ID, (), {})
+
+def test_slow_task_logged_with_duration(monitored_task):
+    """
+    Test that a task slower than the threshold is logged and its duration recorded.
+    """
+    elapsed = SLOW_TASK_THRESHOLD_SECONDS + 1.0
+
+    with patch('app.workers.logger') as mock_logger:
+        _run_hooks(monitored_task, elapsed)
+
+    mock_logger.info.assert_called_once_with(
+        "Task completed successfully",
+        task_id=TEST_TASK_ID,
+        task_name=monitored_task.name,
+        execution_time=pytest.approx(elapsed),
+        correlation_id=None
+    )
+    assert list(monitored_task.metrics['processing_times']) == [pytest.approx(elapsed)]
+    assert monitored_task.metrics['success_count'] == 1
+
+def test_fast_task_not_logged(monitored_task):
+    """
+    Test that a fast task outside the sampling interval is recorded but not logged.
+    """
+    with patch('app.workers.logger') as mock_logger:
+        _run_hooks(monitored_task, 0.1)
+
+    mock_logger.info.assert_not_called()
+    assert list(monitored_task.metrics['processing_times']) == [pytest.approx(0.1)]
@@ -2,14 +2,19 @@
 import pytest
 import pytest_asyncio
 import numpy as np
-from unittest.mock import AsyncMock, patch
+from unittest.mock import ANY, AsyncMock, patch
 from datetime import datetime
 import time
 
 from app.workers.simulation_tasks import (
     simulate_lineup_task,
     analyze_trade_task,
-    simulate_season_task
+    simulate_season_task,
+    _get_redis_service,
+    _get_simulator,
+    _local_cache,
+    _seed_for,
+    generate_cache_key
 )
 from app.ml.monte_carlo import MonteCarloSimulator
 from app.core.exceptions import SimulationError
@@ -20,6 +25,30 @@ TEST_TEAM_ID = 'test_team_123'
 TEST_N_SIMULATIONS = 1000
 PERFORMANCE_THRESHOLD_MS = 2000  # 2 seconds in milliseconds
 
+@pytest.fixture(autouse=True)
+def reset_worker_singletons():
+    """Drop cached worker services and results so each test sees its own patched classes."""
+    _get_redis_service.cache_clear()
+    _get_simulator.cache_clear()
+    _local_cache.clear()
+    yield
+    _get_redis_service.cache_clear()
+    _get_simulator.cache_clear()
+    _local_cache.clear()
+
+def test_seed_for_is_keyed_by_inputs():
+    """
+    Test that simulation streams depend only on the inputs, not on task history.
+    """
+    lineup_key = generate_cache_key('lineup', *TEST_PLAYER_IDS)
+    reordered_key = generate_cache_key('lineup', *reversed(TEST_PLAYER_IDS))
+    season_key = generate_cache_key('season', TEST_TEAM_ID)
+
+    first = _seed_for(lineup_key).generate_state(4)
+    np.testing.assert_array_equal(first, _seed_for(lineup_key).generate_state(4))
+    np.testing.assert_array_equal(first, _seed_for(reordered_key).generate_state(4))
+    assert not np.array_equal(first, _seed_for(season_key).generate_state(4))
+
 @pytest.mark.asyncio
 @patch('app.workers.simulation_tasks.MonteCarloSimulator')
 async def test_simulate_lineup_task(mock_simulator, mock_redis):
@@ -49,7 +78,8 @@ async def test_simulate_lineup_task(mock_simulator, mock_redis):
     
     result = await simulate_lineup_task(
         player_ids=TEST_PLAYER_IDS,
-        n_simulations=TEST_N_SIMULATIONS
+        n_simulations=TEST_N_SIMULATIONS,
+        seed_sequence=ANY
     )
     
     duration_ms = (time.perf_counter() - start_time) * 1000
@@ -57,7 +87,8 @@ async def test_simulate_lineup_task(mock_simulator, mock_redis):
     # Verify simulation execution
     mock_sim_instance.simulate_lineup_performance.assert_called_once_with(
         player_ids=TEST_PLAYER_IDS,
-        n_simulations=TEST_N_SIMULATIONS
+        n_simulations=TEST_N_SIMULATIONS,
+        seed_sequence=ANY
     )
     
     # Verify result structure
@@ -180,7 +211,8 @@ async def test_simulate_season_task(mock_simulator, mock_redis):
     
     result = await simulate_season_task(
         team_id=TEST_TEAM_ID,
-        n_simulations=TEST_N_SIMULATIONS
+        n_simulations=TEST_N_SIMULATIONS,
+        seed_sequence=ANY
     )
     
     duration_ms = (time.perf_counter() - start_time) * 1000
@@ -188,7 +220,8 @@ async def test_simulate_season_task(mock_simulator, mock_redis):
     # Verify simulation parameters
     mock_sim_instance.simulate_season_outcomes.assert_called_once_with(
         team_id=TEST_TEAM_ID,
-        n_simulations=TEST_N_SIMULATIONS
+        n_simulations=TEST_N_SIMULATIONS,
+        seed_sequence=ANY
     )
     
     # Verify result structure